@@ -1,31 +1,56 @@
 
 import os
 from pathlib import Path
-from datetime import timedelta
-from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# Load environment variables from .env file
-load_dotenv(BASE_DIR / '.env')
+# Load environment variables from .env file. Set LOAD_DOTENV=0 where the
+# environment is provided by the orchestrator to skip the file read.
+if os.getenv('LOAD_DOTENV', '1') == '1':
+    from dotenv import load_dotenv
+    load_dotenv(BASE_DIR / '.env')
+
+_TRUE = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _envbool(name, default):
+    """Read a boolean environment variable ('true', '1', 'yes' or 'on')."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE
+
+
+def _envlist(name, default):
+    """Read a comma-separated environment variable, dropping blanks, whitespace and duplicates."""
+    raw = os.environ.get(name, default)
+    # Django and django-cors-headers scan these lists on every request, so
+    # keep them as short as possible while preserving order.
+    return list(dict.fromkeys(item.strip() for item in raw.split(',') if item.strip()))
+
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-fallback-key-change-in-production')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes', 'on')
+DEBUG = _envbool('DEBUG', False)
 
 # Parse ALLOWED_HOSTS from environment variable
-ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
+ALLOWED_HOSTS = _envlist('ALLOWED_HOSTS', 'localhost,127.0.0.1')
+
+# Set ENABLE_ADMIN=False for API-only deployments to drop the Django admin
+# and the messages framework it depends on (app, middleware, context processor).
+ENABLE_ADMIN = _envbool('ENABLE_ADMIN', True)
 
 # Application definition
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    *(['django.contrib.admin'] if ENABLE_ADMIN else []),
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
-    'django.contrib.messages',
+    *(['django.contrib.messages'] if ENABLE_ADMIN else []),
+    # Also needed by drf_yasg for the Swagger/ReDoc UI assets
     'django.contrib.staticfiles',
     
     # Third party apps
@@ -45,7 +70,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    *(['django.contrib.messages.middleware.MessageMiddleware'] if ENABLE_ADMIN else []),
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -61,7 +86,7 @@ TEMPLATES = [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
-                'django.contrib.messages.context_processors.messages',
+                *(['django.contrib.messages.context_processors.messages'] if ENABLE_ADMIN else []),
             ],
         },
     },
@@ -83,6 +108,8 @@ if DATABASE_ENGINE == 'django.db.backends.sqlite3':
             'NAME': BASE_DIR / os.getenv('DATABASE_NAME', 'db.sqlite3'),
         }
     }
+    # SQLite ignores INCLUDE columns on covering indexes; the index still works as a plain one
+    SILENCED_SYSTEM_CHECKS = ['models.W040']
 else:
     # PostgreSQL or other database configuration
     DATABASES = {
@@ -93,6 +120,13 @@ else:
             'PASSWORD': os.getenv('DATABASE_PASSWORD', 'password'),
             'HOST': os.getenv('DATABASE_HOST', 'localhost'),
             'PORT': os.getenv('DATABASE_PORT', '5432'),
+            # Reuse connections across requests; set DB_CONN_MAX_AGE=0 behind PgBouncer
+            'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', 5)),
+                'application_name': 'loanpro',
+            },
         }
     }
 
@@ -132,7 +166,7 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'helpers.response.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -144,12 +178,12 @@ REST_FRAMEWORK = {
 }
 
 # CORS Configuration
-CORS_ALLOWED_ORIGINS = os.getenv(
-    'CORS_ALLOWED_ORIGINS', 
+CORS_ALLOWED_ORIGINS = _envlist(
+    'CORS_ALLOWED_ORIGINS',
     'http://localhost:3000,http://127.0.0.1:3000,http://localhost:8080,http://127.0.0.1:8080'
-).split(',')
+)
 
-CORS_ALLOW_CREDENTIALS = os.getenv('CORS_ALLOW_CREDENTIALS', 'True').lower() in ('true', '1', 'yes', 'on')
+CORS_ALLOW_CREDENTIALS = _envbool('CORS_ALLOW_CREDENTIALS', True)
 
 # Internationalization
 LANGUAGE_CODE = os.getenv('LANGUAGE_CODE', 'en-us')
@@ -197,6 +231,9 @@ TWILIO_AUTH_TOKEN = os.getenv('TWILIO_AUTH_TOKEN', '')
 TWILIO_FROM_NUMBER = os.getenv('TWILIO_FROM_NUMBER', '')
 
 # Logging Configuration
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_FILE = os.getenv('LOG_FILE', 'loanpro.log')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -211,12 +248,6 @@ LOGGING = {
         },
     },
     'handlers': {
-        'file': {
-            'level': os.getenv('LOG_LEVEL', 'INFO'),
-            'class': 'logging.FileHandler',
-            'filename': os.getenv('LOG_FILE', 'loanpro.log'),
-            'formatter': 'verbose',
-        },
         'console': {
             'level': os.getenv('CONSOLE_LOG_LEVEL', 'DEBUG'),
             'class': 'logging.StreamHandler',
@@ -226,26 +257,56 @@ LOGGING = {
     'loggers': {
         'loanpro': {
             'handlers': ['file', 'console'],
-            'level': os.getenv('LOG_LEVEL', 'INFO'),
+            'level': LOG_LEVEL,
             'propagate': True,
         },
     },
 }
 
+# Outside DEBUG, file writes happen on a per-process background thread so
+# request threads never block on disk I/O.
+LOGGING['handlers']['file'] = {
+    'level': LOG_LEVEL,
+    'formatter': 'verbose',
+    'filename': LOG_FILE,
+}
+if DEBUG:
+    LOGGING['handlers']['file']['class'] = 'logging.FileHandler'
+else:
+    LOGGING['handlers']['file']['()'] = 'helpers.log_handlers.QueueFileHandler'
+
 # Cache Configuration
+# django-redis keeps a pooled connection per worker; redis-py parses replies
+# with hiredis automatically when it is installed. REDIS_URL may also point at
+# a unix socket for co-located Redis (e.g. unix:///var/run/redis/redis.sock?db=1).
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'BACKEND': 'django_redis.cache.RedisCache',
         'LOCATION': os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+        # Bump CACHE_VERSION (or change the prefix) on deploys that change
+        # cached data so old keys are simply missed instead of flushed.
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'loanpro'),
+        'VERSION': int(os.getenv('CACHE_VERSION', 1)),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': int(os.getenv('REDIS_MAX_CONNECTIONS', 100)),
+                'retry_on_timeout': True,
+            },
+            'IGNORE_EXCEPTIONS': True,
+        },
     }
 }
 
 # Session Configuration
-SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+# cached_db reads through Redis but keeps the DB as the source of truth, so a
+# cache restart does not log everyone out. Set to
+# 'django.contrib.sessions.backends.signed_cookies' to skip the cache entirely.
+SESSION_ENGINE = os.getenv('SESSION_ENGINE', 'django.contrib.sessions.backends.cached_db')
 SESSION_CACHE_ALIAS = 'default'
 SESSION_COOKIE_AGE = int(os.getenv('SESSION_COOKIE_AGE', 3600))  # 1 hour
-SESSION_COOKIE_SECURE = os.getenv('SESSION_COOKIE_SECURE', str(not DEBUG)).lower() in ('true', '1', 'yes', 'on')
-SESSION_COOKIE_HTTPONLY = os.getenv('SESSION_COOKIE_HTTPONLY', 'True').lower() in ('true', '1', 'yes', 'on')
+SESSION_COOKIE_SECURE = _envbool('SESSION_COOKIE_SECURE', not DEBUG)
+SESSION_COOKIE_HTTPONLY = _envbool('SESSION_COOKIE_HTTPONLY', True)
 
 # File Upload Settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv('FILE_UPLOAD_MAX_MEMORY_SIZE', 5242880))  # 5MB
@@ -0,0 +1,51 @@
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueueFileHandler(QueueHandler):
+    '''
+    File handler that hands records to a background thread instead of writing inline
+
+    The listener thread is started on the first record emitted in each process,
+    so forked workers (e.g. gunicorn --preload) get their own queue and drain
+    thread, and management commands that never log start no thread at all.
+    Configure it with the '()' factory key so dictConfig treats it as a plain
+    handler on every Python version.
+    '''
+
+    def __init__(self, filename, encoding=None):
+        super().__init__(queue.Queue())
+        self.filename = filename
+        self.encoding = encoding
+        self._listener = None
+        self._pid = None
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def _start_listener(self):
+        # A queue inherited across fork has no reader in this process
+        self.queue = queue.Queue()
+        self._pid = os.getpid()
+        # prepare() has already applied this handler's formatter to record.msg
+        file_handler = logging.FileHandler(self.filename, encoding=self.encoding, delay=True)
+        self._listener = QueueListener(self.queue, file_handler)
+        self._listener.start()
+        atexit.register(self._stop_listener, self._pid)
+
+    def _stop_listener(self, pid=None):
+        # Flush what is still queued; only the process that started the thread may join it
+        if self._listener is not None and (pid or self._pid) == os.getpid():
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+
+    def close(self):
+        self._stop_listener()
+        super().close()
@@ -1,31 +1,61 @@
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from functools import lru_cache
+from urllib.parse import urlencode
+
+
+@lru_cache(maxsize=256)
+def _build_page_url(base, query_items, page_query_param, page_number):
+    """
+    Build a page link the same way DRF's replace_query_param/remove_query_param do.
+    A page_number of None drops the page parameter (DRF's link for page 1).
+    """
+    query = dict(query_items)
+    if page_number is None:
+        query.pop(page_query_param, None)
+    else:
+        query[page_query_param] = (str(page_number),)
+    query_string = urlencode(sorted(query.items()), doseq=True)
+    return f"{base}?{query_string}" if query_string else base
 
 
 class CustomPagination(PageNumberPagination):
     def get_paginated_response(self, data, is_filter=False):
+        count = self.page.paginator.count
+        page = self.page
+        next_link = previous_link = None
+        if page.has_next() or page.has_previous():
+            # Build the base URL and query once, then reuse them for both links
+            base = self.request.build_absolute_uri(self.request.path)
+            query_items = tuple(sorted((key, tuple(values)) for key, values in self.request.query_params.lists()))
+            if page.has_next():
+                next_link = _build_page_url(base, query_items, self.page_query_param, page.next_page_number())
+            if page.has_previous():
+                previous_number = page.previous_page_number()
+                previous_link = _build_page_url(base, query_items, self.page_query_param, previous_number if previous_number != 1 else None)
         return Response({
             'metadata': {
-                'count': self.page.paginator.count,
+                'count': count,
                 'is_filter': is_filter,
-                "has_records": True if (self.page.paginator.count > 0 and is_filter) or self.page.paginator.count > 0 else False,
+                "has_records": count > 0,
                 'page_size': self.page_size,
                 'page': self.page.number,
-                'next': self.get_next_link(),
-                'previous': self.get_previous_link(),
+                'next': next_link,
+                'previous': previous_link,
             },
             'results': data
         })
 
 class Paginator:
-    paginator = CustomPagination()
-
     def __init__(self, records, request):
         """
         Method that paginate all the records
         """
         self.records = records
         self.request = request
+        # Per instance: paginate() sets page_size and paginate_queryset() stores
+        # the current page/request, so sharing one across requests races.
+        self.paginator = CustomPagination()
 
     def paginate(self, no_of_record: int):
         self.paginator.page_size = no_of_record
@@ -37,20 +67,25 @@ class Paginator:
 
 
 class PaginatorCustom:
-    paginator = CustomPagination()
-
-    def __init__(self, records, request, serialize_func, func_param={}, is_filter=False):
+    def __init__(self, records, request, serialize_func=None, func_param={}, is_filter=False, bulk_serialize_func=None):
         """
         Initialize the paginator with a queryset, request, and a dynamic serialization function.
         :param records: The queryset or list of records to paginate
         :param request: The request object for pagination context
         :param serialize_func: A callable function that handles serialization for each record
+        :param bulk_serialize_func: A callable that serializes the whole page in one call,
+            e.g. ``lambda qs, **kw: MySerializer(qs, many=True, context=kw).data``.
+            Takes precedence over serialize_func when both are given.
         """
+        if serialize_func is None and bulk_serialize_func is None:
+            raise ValueError("Either serialize_func or bulk_serialize_func is required")
         self.records = records
         self.request = request
         self.serialize_func = serialize_func 
+        self.bulk_serialize_func = bulk_serialize_func
         self.func_param = func_param
         self.is_filter = is_filter
+        self.paginator = CustomPagination()
 
     def paginate(self, no_of_record: int):
         """
@@ -60,7 +95,12 @@ class PaginatorCustom:
         self.paginator.page_size = no_of_record
         result_page = self.paginator.paginate_queryset(self.records, self.request)
 
-        print(len(result_page))
-        # Apply the dynamic serialization function to each record in the paginated result
-        serialized_data = [self.serialize_func(record,**self.func_param) for record in result_page]
+        if self.bulk_serialize_func is not None:
+            # Serialize the whole page at once so related rows can be batched
+            serialized_data = self.bulk_serialize_func(result_page, **self.func_param)
+        else:
+            # Apply the dynamic serialization function to each record in the paginated result
+            serialize_func = self.serialize_func
+            func_param = self.func_param
+            serialized_data = [serialize_func(record, **func_param) for record in result_page]
         return self.paginator.get_paginated_response(serialized_data, self.is_filter)
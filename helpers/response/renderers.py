@@ -0,0 +1,32 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# Types orjson does not handle natively (Decimal, lazy strings, ...) fall back
+# to DRF's encoder so the wire format matches JSONRenderer.
+_default = JSONEncoder().default
+
+# Datetimes go through DRF's encoder too, which emits 'Z' instead of '+00:00'.
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(data):
+    '''
+    Serialize data to JSON bytes the same way ORJSONRenderer does
+    '''
+    return orjson.dumps(data, default=_default, option=_OPTIONS)
+
+
+class ORJSONRenderer(BaseRenderer):
+    '''
+    JSON renderer backed by orjson
+    '''
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps(data)
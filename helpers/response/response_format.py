@@ -1,8 +1,16 @@
 from rest_framework.response import Response
 from rest_framework import status
-from .code import status_code
+from django.http import StreamingHttpResponse
 from .pagination import Paginator
+from .renderers import dumps
 from urllib.parse import urlencode
+from http import HTTPStatus
+
+_VALIDATION_MESSAGE = "validation failed"
+_VALIDATION_STATUS = status.HTTP_422_UNPROCESSABLE_ENTITY
+
+# Rows fetched per round trip (and per prefetch batch) while streaming a page
+_STREAM_CHUNK_SIZE = 100
 
 class DataResponse:
     def __init__(self, success: bool = True, message: str = None, code: int = None, response_code: str = None):
@@ -10,14 +18,14 @@ class DataResponse:
         self.success = success
         self.message = message
         self.response_code = response_code
-        self._code = status_code()[code]
+        self._code = HTTPStatus(code).value
 
     def result(self):
-        data = dict(
-            success=self.success,
-            response_code=self.response_code,
-            response=self.message
-        )
+        data = {
+            'success': self.success,
+            'response_code': self.response_code,
+            'response': self.message
+        }
         return Response(data=data, status=self._code)
     
 
@@ -31,9 +39,8 @@ def error_response(message='An error occurred', group='BAD_REQUEST', status_code
 
 
 def validation_error_response(errors=None):
-    message = "validation failed"
-    response_data = {'status': False,'message': message, 'detail': message, 'errors': errors}
-    return Response(response_data, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+    response_data = {'status': False,'message': _VALIDATION_MESSAGE, 'detail': _VALIDATION_MESSAGE, 'errors': errors}
+    return Response(response_data, status=_VALIDATION_STATUS)
 
 
 
@@ -62,7 +69,12 @@ def paginate_success_response(request, data=[],page_size=10):
 
 
 
-def paginate_success_response_with_serializer(request, serializer, data=[], page_size=10, addition_serializer_data=None):
+def _paginate_page(request, data, page_size, is_filter):
+    """
+    Fetch the requested page of data and build its pagination metadata.
+
+    Returns a (page, metadata) tuple shared by the paginated response helpers.
+    """
     from django.core.paginator import Paginator, EmptyPage
     # Step 1: Set up the paginator
     paginator = Paginator(data, page_size)
@@ -71,11 +83,8 @@ def paginate_success_response_with_serializer(request, serializer, data=[], page
         page = paginator.page(page_number)
     except EmptyPage:
         page = paginator.page(paginator.num_pages)  # Return the last page if the page number is out of range
-    
-    # Step 2: Serialize the paginated data
-    transactions_serializer = serializer(page.object_list, many=True, context={'request': request,'addition_serializer_data':addition_serializer_data})
 
-    # Step 3: Build URLs for the next and previous pages
+    # Step 2: Build URLs for the next and previous pages
     base_url = request.build_absolute_uri(request.path)  # Get the base URL (the current request's URL)
     query_params = request.GET.dict()  # Get current query params
 
@@ -94,26 +103,55 @@ def paginate_success_response_with_serializer(request, serializer, data=[], page
         query_params['page'] = page.previous_page_number()
         previous_link = f"{base_url}?{urlencode(query_params)}"  # Construct the previous page link
 
-    # Step 4: Prepare the response format
-    response_data = {
-        'metadata': {
-            'count': paginator.count,  # Total number of records
-            'is_filter': bool(data),  # If data is filtered, set this to True (you can adjust this logic)
-            'has_records': True if paginator.count > 0 else False,  # Whether there are records
-            'page_size': page_size,  # The size of each page
-            'page': page.number,  # Current page number
-            'next': next_link,  # Next page link
-            'previous': previous_link,  # Previous page link
-        },
-        'results': transactions_serializer.data  # Serialized results for the current page
+    metadata = {
+        'count': paginator.count,  # Total number of records
+        'is_filter': is_filter,  # Whether the caller applied filters to data
+        'has_records': paginator.count > 0,  # Whether there are records
+        'page_size': page_size,  # The size of each page
+        'page': page.number,  # Current page number
+        'next': next_link,  # Next page link
+        'previous': previous_link,  # Previous page link
     }
+    return page, metadata
 
-    return Response(response_data)
 
+def paginate_success_response_with_serializer(request, serializer, data=[], page_size=10, addition_serializer_data=None, is_filter=False):
+    page, metadata = _paginate_page(request, data, page_size, is_filter)
 
+    # Serialize the paginated data
+    transactions_serializer = serializer(page.object_list, many=True, context={'request': request,'addition_serializer_data':addition_serializer_data})
+
+    response_data = {
+        'metadata': metadata,
+        'results': transactions_serializer.data  # Serialized results for the current page
+    }
 
+    return Response(response_data)
 
 
-def paginate_success_response(request, data=[],page_size=10):
-    paginator = Paginator(data,request)
-    return paginator.paginate(page_size)
\ No newline at end of file
+def paginate_streaming_response(request, serializer, data=[], page_size=10, addition_serializer_data=None, is_filter=False):
+    """
+    Same payload as paginate_success_response_with_serializer, but streamed.
+
+    Rows are serialized and written one at a time, so memory stays flat and the
+    first bytes go out before the whole page is serialized. Use it for
+    endpoints that return large pages.
+    """
+    page, metadata = _paginate_page(request, data, page_size, is_filter)
+    row_serializer = serializer(context={'request': request,'addition_serializer_data':addition_serializer_data})
+
+    records = page.object_list
+    if hasattr(records, 'iterator'):
+        # Don't fill the queryset result cache; rows are dropped once written.
+        # An explicit chunk_size keeps prefetch_related() working.
+        records = records.iterator(chunk_size=_STREAM_CHUNK_SIZE)
+
+    def stream():
+        yield b'{"metadata":' + dumps(metadata) + b',"results":['
+        separator = b''
+        for record in records:
+            yield separator + dumps(row_serializer.to_representation(record))
+            separator = b','
+        yield b']}'
+
+    return StreamingHttpResponse(stream(), content_type='application/json')
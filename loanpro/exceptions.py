@@ -9,12 +9,125 @@ or invalid data in POST requests.
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.http import Http404
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Hints added to validation errors for commonly mistyped fields
+_SUGGESTION_MAP = {
+    'username': "Check your username format and requirements.",
+    'email': "Check your email format and requirements.",
+    'password': "Check your password format and requirements.",
+    'phone_number': "Ensure phone number contains at least 10 digits.",
+    'amount': "Verify the loan amount is within acceptable limits.",
+    'otp_code': "Make sure the OTP code is 6 digits and hasn't expired.",
+}
+
+# Message and suggestions for non-validation error statuses
+_STATUS_TEMPLATES = {
+    status.HTTP_401_UNAUTHORIZED: (
+        'Authentication failed. Please check your credentials.',
+        [
+            'Verify your username and password are correct.',
+            'Make sure your account is active.',
+            'Try logging in again.'
+        ]
+    ),
+    status.HTTP_403_FORBIDDEN: (
+        'You do not have permission to perform this action.',
+        [
+            'Contact your administrator if you believe you should have access.',
+            'Make sure you are logged in with the correct account.'
+        ]
+    ),
+    status.HTTP_404_NOT_FOUND: (
+        'The requested resource was not found.',
+        [
+            'Check the URL and try again.',
+            'Make sure the resource exists and you have access to it.'
+        ]
+    ),
+}
+
+_SERVER_ERROR_TEMPLATE = (
+    'An internal server error occurred. Please try again later.',
+    [
+        'Try again in a few moments.',
+        'Contact support if the problem persists.'
+    ]
+)
+
+
+def _as_list(errors):
+    return errors if isinstance(errors, list) else [errors]
+
+
+def _handle_validation_error(exc, data):
+    """Build the message and details for a 400 Bad Request."""
+    message = 'Validation failed. Please check the provided data.'
+    details = {}
+    
+    # Handle list of errors
+    if not isinstance(data, dict):
+        details['errors'] = data
+        return message, details
+    
+    # Handle field-specific errors
+    field_errors = {}
+    general_errors = []
+    
+    for field, errors in data.items():
+        if field == 'non_field_errors':
+            general_errors.extend(_as_list(errors))
+        elif field == 'missing_fields':
+            message = 'Required fields are missing.'
+            general_errors.extend(_as_list(errors))
+        else:
+            field_errors[field] = _as_list(errors)
+    
+    if field_errors:
+        details['field_errors'] = field_errors
+        
+    if general_errors:
+        details['general_errors'] = general_errors
+        
+    # Provide helpful suggestions for common errors
+    suggestions = [_SUGGESTION_MAP[field] for field in field_errors if field in _SUGGESTION_MAP]
+    if suggestions:
+        details['suggestions'] = suggestions
+    
+    return message, details
+
+
+def _handle_method_not_allowed(exc, data):
+    """Build the message and details for a 405 Method Not Allowed."""
+    return 'This HTTP method is not allowed for this endpoint.', {'allowed_methods': data.get('detail', '')}
+
+
+def _handle_server_error(exc, data):
+    """Build the message and details for a 5xx error and log it."""
+    # Log server errors for debugging
+    logger.error("Server error: %s", exc, exc_info=True)
+    message, suggestions = _SERVER_ERROR_TEMPLATE
+    return message, {'suggestions': list(suggestions)}
+
+
+def _template_handler(template):
+    message, suggestions = template
+    return lambda exc, data: (message, {'suggestions': list(suggestions)})
+
+
+# Status code -> handler returning (message, details)
+_HANDLERS = {
+    status.HTTP_400_BAD_REQUEST: _handle_validation_error,
+    status.HTTP_405_METHOD_NOT_ALLOWED: _handle_method_not_allowed,
+    **{code: _template_handler(template) for code, template in _STATUS_TEMPLATES.items()},
+}
+
 
 def custom_exception_handler(exc, context):
     """
@@ -31,111 +144,47 @@ def custom_exception_handler(exc, context):
     # Call REST framework's default exception handler first
     response = exception_handler(exc, context)
     
-    if response is not None:
-        custom_response_data = {
-            'error': True,
-            'message': 'An error occurred while processing your request.',
-            'details': {},
-            'status_code': response.status_code
+    if response is None:
+        return response
+    
+    request = context.get('request') if context else None
+    # CORS preflights never show an error body, so skip formatting it
+    if request is not None and getattr(request, 'method', None) == 'OPTIONS':
+        return response
+    
+    status_code = response.status_code
+    handler = _HANDLERS.get(status_code)
+    if handler is None and status_code >= 500:
+        handler = _handle_server_error
+    
+    if handler is None:
+        message, details = 'An error occurred while processing your request.', {}
+    else:
+        message, details = handler(exc, response.data)
+    
+    # Add request information for debugging (in development only)
+    if settings.DEBUG and request is not None and hasattr(request, 'method'):
+        details['request_info'] = {
+            'method': request.method,
+            'path': request.path,
         }
-        
-        # Handle validation errors (400 Bad Request)
-        if response.status_code == status.HTTP_400_BAD_REQUEST:
-            custom_response_data['message'] = 'Validation failed. Please check the provided data.'
-            
-            # Handle field-specific errors
-            if isinstance(response.data, dict):
-                field_errors = {}
-                general_errors = []
-                
-                for field, errors in response.data.items():
-                    if field == 'non_field_errors':
-                        general_errors.extend(errors if isinstance(errors, list) else [errors])
-                    elif field == 'missing_fields':
-                        custom_response_data['message'] = 'Required fields are missing.'
-                        general_errors.extend(errors if isinstance(errors, list) else [errors])
-                    else:
-                        field_errors[field] = errors if isinstance(errors, list) else [errors]
-                
-                if field_errors:
-                    custom_response_data['details']['field_errors'] = field_errors
-                    
-                if general_errors:
-                    custom_response_data['details']['general_errors'] = general_errors
-                    
-                # Provide helpful suggestions for common errors
-                if field_errors:
-                    suggestions = []
-                    for field in field_errors.keys():
-                        if field in ['username', 'email', 'password']:
-                            suggestions.append(f"Check your {field} format and requirements.")
-                        elif field == 'phone_number':
-                            suggestions.append("Ensure phone number contains at least 10 digits.")
-                        elif field == 'amount':
-                            suggestions.append("Verify the loan amount is within acceptable limits.")
-                        elif field == 'otp_code':
-                            suggestions.append("Make sure the OTP code is 6 digits and hasn't expired.")
-                    
-                    if suggestions:
-                        custom_response_data['details']['suggestions'] = suggestions
-            
-            else:
-                # Handle list of errors
-                custom_response_data['details']['errors'] = response.data
-        
-        # Handle authentication errors (401 Unauthorized)
-        elif response.status_code == status.HTTP_401_UNAUTHORIZED:
-            custom_response_data['message'] = 'Authentication failed. Please check your credentials.'
-            custom_response_data['details']['suggestions'] = [
-                'Verify your username and password are correct.',
-                'Make sure your account is active.',
-                'Try logging in again.'
-            ]
-        
-        # Handle permission errors (403 Forbidden)
-        elif response.status_code == status.HTTP_403_FORBIDDEN:
-            custom_response_data['message'] = 'You do not have permission to perform this action.'
-            custom_response_data['details']['suggestions'] = [
-                'Contact your administrator if you believe you should have access.',
-                'Make sure you are logged in with the correct account.'
-            ]
-        
-        # Handle not found errors (404 Not Found)
-        elif response.status_code == status.HTTP_404_NOT_FOUND:
-            custom_response_data['message'] = 'The requested resource was not found.'
-            custom_response_data['details']['suggestions'] = [
-                'Check the URL and try again.',
-                'Make sure the resource exists and you have access to it.'
-            ]
-        
-        # Handle method not allowed (405 Method Not Allowed)
-        elif response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED:
-            custom_response_data['message'] = 'This HTTP method is not allowed for this endpoint.'
-            custom_response_data['details']['allowed_methods'] = response.data.get('detail', '')
-        
-        # Handle server errors (500 Internal Server Error)
-        elif response.status_code >= 500:
-            custom_response_data['message'] = 'An internal server error occurred. Please try again later.'
-            custom_response_data['details']['suggestions'] = [
-                'Try again in a few moments.',
-                'Contact support if the problem persists.'
-            ]
-            # Log server errors for debugging
-            logger.error(f"Server error: {exc}", exc_info=True)
-        
-        # Add request information for debugging (in development)
-        if context and hasattr(context.get('request'), 'method'):
-            request = context['request']
-            custom_response_data['details']['request_info'] = {
-                'method': request.method,
-                'path': request.path,
-            }
-        
-        response.data = custom_response_data
+    
+    response.data = {
+        'error': True,
+        'message': message,
+        'details': details,
+        'status_code': status_code
+    }
     
     return response
 
 
+@lru_cache(maxsize=512)
+def _humanize(field):
+    """Turn a field name like 'phone_number' into 'Phone Number'."""
+    return field.replace('_', ' ').title()
+
+
 def handle_missing_data_error(missing_fields, model_name=""):
     """
     Generate a standardized error response for missing required fields.
@@ -147,7 +196,7 @@ def handle_missing_data_error(missing_fields, model_name=""):
     Returns:
         dict: Formatted error response
     """
-    field_names = [field.replace('_', ' ').title() for field in missing_fields]
+    field_names = [_humanize(field) for field in missing_fields]
     
     return {
         'error': True,
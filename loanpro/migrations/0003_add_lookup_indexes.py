@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('loanpro', '0002_customer_approval_status_customer_assigned_by_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['approval_status'], name='loanpro_cus_approva_a04e0c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['assigned_staff', 'approval_status'], name='loanpro_cus_assigne_835ab8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kycverification',
+            index=models.Index(fields=['verification_status'], name='loanpro_kyc_verific_fb7cd9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(fields=['status', 'customer'], name='loanpro_loa_status_4d977d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(fields=['customer', 'created_at'], name='loanpro_loa_custome_24d5fe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role'], name='loanpro_use_role_2cf643_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loanpro', '0003_add_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(fields=['status', '-created_at'], name='loanpro_loa_status_48b6f7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(fields=['status'], include=('amount', 'due_date', 'customer'), name='loanpro_loan_status_covering'),
+        ),
+    ]
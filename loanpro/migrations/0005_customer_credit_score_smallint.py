@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:36
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loanpro', '0004_loan_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customer',
+            name='credit_score',
+            field=models.PositiveSmallIntegerField(default=300, help_text='Customer credit score (300-850) used for loan risk assessment', validators=[django.core.validators.MinValueValidator(300), django.core.validators.MaxValueValidator(850)]),
+        ),
+    ]
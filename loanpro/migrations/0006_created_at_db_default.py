@@ -0,0 +1,54 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:36
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loanpro', '0005_customer_credit_score_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='timestamp',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='customer',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False, help_text='Timestamp when the customer account was created'),
+        ),
+        migrations.AlterField(
+            model_name='document',
+            name='uploaded_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False, help_text='Timestamp when the document was uploaded'),
+        ),
+        migrations.AlterField(
+            model_name='kycverification',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False, help_text='When the KYC verification record was created'),
+        ),
+        migrations.AlterField(
+            model_name='loan',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False, help_text='Timestamp when the loan application was created'),
+        ),
+        migrations.AlterField(
+            model_name='otpverification',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False, help_text='Timestamp when the user account was created'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loanpro', '0006_created_at_db_default'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customer',
+            name='tier',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Tier 1 - Basic verification'), (2, 'Tier 2 - Additional verification'), (3, 'Tier 3 - Advanced verification'), (4, 'Tier 4 - Full verification')], default=1, help_text='Customer verification tier (1-4) determining borrowing limits'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loanpro', '0007_customer_tier_smallint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kycverification',
+            name='fully_verified',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('bvn_verified', True), ('nin_verified', True), ('verification_status', 'verified')), output_field=models.BooleanField()),
+        ),
+        migrations.AddIndex(
+            model_name='kycverification',
+            index=models.Index(condition=models.Q(('fully_verified', True)), fields=['customer'], name='loanpro_kyc_fully_verified'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loanpro', '0009_payment_audit_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='customer',
+            constraint=models.CheckConstraint(condition=models.Q(('credit_score__gte', 300), ('credit_score__lte', 850)), name='customer_credit_score_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='customer',
+            constraint=models.CheckConstraint(condition=models.Q(('current_borrow_limit__gte', 0)), name='customer_borrow_limit_non_negative'),
+        ),
+    ]
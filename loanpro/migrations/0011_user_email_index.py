@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-15 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('loanpro', '0010_customer_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['email'], name='loanpro_use_email_77a12f_idx'),
+        ),
+    ]
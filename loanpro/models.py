@@ -16,13 +16,99 @@ Models:
 """
 
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Coalesce, Now
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.core.validators import MinValueValidator, MaxValueValidator
 import uuid
-from decimal import Decimal
-from datetime import datetime, timedelta
-import random
-import string
+from decimal import Decimal, ROUND_HALF_UP
+from datetime import timedelta
+import secrets
+
+# Account numbers drawn before giving up on inserting a customer, see Customer.save
+_ACCOUNT_NUMBER_ATTEMPTS = 3
+
+# Base borrowing limit per verification tier, see Customer.get_base_limit_for_tier
+_TIER_LIMITS = {
+    1: Decimal('200000.00'),
+    2: Decimal('500000.00'),
+    3: Decimal('2000000.00'),
+    4: Decimal('5000000.00'),
+}
+_NO_LIMIT = Decimal('0.00')
+
+# Smallest currency unit that repayment amounts are rounded to
+_KOBO = Decimal('0.01')
+
+# (minimum credit score, multiplier) from highest to lowest, see _multiplier_for
+_LIMIT_MULTIPLIERS = (
+    (750, Decimal('1.5')),
+    (650, Decimal('1.3')),
+    (550, Decimal('1.1')),
+)
+_DEFAULT_LIMIT_MULTIPLIER = Decimal('0.8')
+
+
+def _multiplier_for(credit_score):
+    """Return the borrowing limit multiplier for a credit score."""
+    for threshold, multiplier in _LIMIT_MULTIPLIERS:
+        if credit_score >= threshold:
+            return multiplier
+    return _DEFAULT_LIMIT_MULTIPLIER
+
+
+# Per-customer loan/payment counts behind the credit score, aggregated over Loan rows.
+# Late payments include unpaid ones, as in Payment.is_on_time()
+_CREDIT_STATS = {
+    'total_loans': models.Count('id', distinct=True),
+    'total_payments': models.Count('payments'),
+    'on_time_payments': models.Count(
+        'payments',
+        filter=models.Q(payments__paid_date__lte=models.F('payments__due_date')),
+    ),
+}
+
+
+def _credit_score_from(stats, tier):
+    """Score a customer from their _CREDIT_STATS counts; see Customer.calculate_credit_score."""
+    total_loans = stats['total_loans']
+    if not total_loans:
+        return 300  # Base score
+    
+    score = 300  # Base score
+    on_time_payments = stats['on_time_payments']
+    late_payments = stats['total_payments'] - on_time_payments
+    
+    # On-time payment factor (+150 max)
+    if on_time_payments + late_payments > 0:
+        on_time_ratio = on_time_payments / (on_time_payments + late_payments)
+        score += int(on_time_ratio * 150)
+    
+    # Loan history length factor (+50 max)
+    if total_loans > 0:
+        history_factor = min(total_loans * 10, 50)
+        score += history_factor
+    
+    # Tier level factor (+100 max)
+    tier_factor = tier * 25
+    score += tier_factor
+    
+    # Late payment penalty (-200 max)
+    if late_payments > 0:
+        penalty = min(late_payments * 20, 200)
+        score -= penalty
+    
+    return min(max(score, 300), 850)  # Keep between 300-850
+
+
+def _base_limit_expression():
+    """SQL CASE mapping Customer.tier to its base borrowing limit from _TIER_LIMITS."""
+    return models.Case(
+        *[models.When(tier=tier, then=models.Value(limit)) for tier, limit in _TIER_LIMITS.items()],
+        default=models.Value(_NO_LIMIT),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+    )
 
 
 class User(AbstractUser):
@@ -52,6 +138,8 @@ class User(AbstractUser):
         ('account_officer', 'Account Officer'),
         ('customer', 'Customer'),
     ]
+    # Label lookup for __str__; get_role_display() rebuilds a choices dict per call
+    _ROLE_LABELS = dict(ROLE_CHOICES)
     
     # User role in the system - determines access permissions and capabilities
     role = models.CharField(
@@ -77,7 +165,8 @@ class User(AbstractUser):
     
     # Audit timestamps for tracking account creation and updates
     created_at = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the user account was created"
     )
     updated_at = models.DateTimeField(
@@ -85,6 +174,13 @@ class User(AbstractUser):
         help_text="Timestamp when the user account was last updated"
     )
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['role']),
+            # Registration checks email alongside the unique username and phone_number
+            models.Index(fields=['email']),
+        ]
+
     def __str__(self):
         """
         String representation of the user.
@@ -92,7 +188,7 @@ class User(AbstractUser):
         Returns:
             str: Username and role display for easy identification
         """
-        return f"{self.username} ({self.get_role_display()})"
+        return f"{self.username} ({self._ROLE_LABELS.get(self.role, self.role)})"
 
 
 class KYCVerification(models.Model):
@@ -124,6 +220,7 @@ class KYCVerification(models.Model):
         ('rejected', 'Verification Rejected'),
         ('incomplete', 'Incomplete Information'),
     ]
+    _VERIFICATION_STATUS_LABELS = dict(VERIFICATION_STATUS_CHOICES)
     
     customer = models.OneToOneField(
         'Customer',
@@ -192,7 +289,8 @@ class KYCVerification(models.Model):
     
     # Audit timestamps
     created_at = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="When the KYC verification record was created"
     )
     
@@ -201,9 +299,24 @@ class KYCVerification(models.Model):
         help_text="When the KYC verification record was last updated"
     )
     
+    # Database-maintained copy of is_fully_verified() so eligibility filters can use an index
+    fully_verified = models.GeneratedField(
+        expression=models.Q(bvn_verified=True, nin_verified=True, verification_status='verified'),
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
+    
     class Meta:
         verbose_name = "KYC Verification"
         verbose_name_plural = "KYC Verifications"
+        indexes = [
+            models.Index(fields=['verification_status']),
+            models.Index(
+                fields=['customer'],
+                condition=models.Q(fully_verified=True),
+                name='loanpro_kyc_fully_verified',
+            ),
+        ]
     
     def is_fully_verified(self):
         """
@@ -214,6 +327,11 @@ class KYCVerification(models.Model):
         """
         return self.bvn_verified and self.nin_verified and self.verification_status == 'verified'
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if KYCVerification.customer.is_cached(self):
+            self.customer._clear_eligibility_cache()
+    
     def get_verification_progress(self):
         """
         Get verification progress percentage.
@@ -235,7 +353,108 @@ class KYCVerification(models.Model):
         Returns:
             str: Customer name and verification status
         """
-        return f"KYC for {self.customer.user.get_full_name()} - {self.get_verification_status_display()}"
+        return f"KYC for {self.customer.user.get_full_name()} - {self._VERIFICATION_STATUS_LABELS.get(self.verification_status, self.verification_status)}"
+
+
+class CustomerQuerySet(models.QuerySet):
+    def lean(self):
+        """
+        Skip the free-text address column, the widest field on the customer row.
+        
+        Reading customer.address on a lean instance costs one extra query,
+        so only use this where the address is not displayed or serialized.
+        """
+        return self.defer('address')
+
+    def with_eligibility_data(self):
+        """
+        Load the relations read by Customer.can_apply_for_loan() in the same query.
+        
+        Use this for any queryset whose customers are checked for loan
+        eligibility or KYC status, so each row doesn't lazily fetch its
+        KYC record and assigned staff member.
+        """
+        return self.select_related('kyc_verification', 'assigned_staff')
+
+    def with_loan_guards(self):
+        """
+        with_eligibility_data() plus has_active_loan, whether the customer already has an active loan.
+        
+        Covers every check LoanCreateSerializer.validate() makes, so a loan
+        application looks the customer up in a single query.
+        """
+        active_loans = Loan.objects.filter(customer=models.OuterRef('pk'), status='active')
+        return self.with_eligibility_data().annotate(has_active_loan=models.Exists(active_loans))
+
+    def with_loan_history(self):
+        """
+        Prefetch each customer's loans and payments with only the columns scoring needs.
+        
+        Fallback for scoring rules that can't be written as an aggregate
+        (see bulk_recompute). Touching other Loan/Payment fields triggers a
+        query per object, so keep the only() lists in sync with any new rule.
+        """
+        payments = Payment.objects.only('id', 'loan', 'amount', 'paid_date', 'due_date', 'status')
+        loans = Loan.objects.only('id', 'customer', 'amount', 'status').prefetch_related(
+            models.Prefetch('payments', queryset=payments)
+        )
+        return self.prefetch_related(models.Prefetch('loans', queryset=loans))
+
+    def with_base_limit(self):
+        """
+        Annotate each customer with base_limit, the SQL form of get_base_limit_for_tier().
+        
+        Lets portfolio reports sum or compare tier limits in the query.
+        """
+        return self.annotate(base_limit=_base_limit_expression())
+
+    def refresh_borrow_limits(self):
+        """
+        Recalculate current_borrow_limit for every customer in the queryset in one UPDATE.
+        
+        Applies the same tier limits and credit score multipliers as
+        Customer.update_borrow_limit(), without loading any rows.
+        
+        Returns:
+            int: Number of customers updated
+        """
+        base_limit = _base_limit_expression()
+        money = models.DecimalField(max_digits=12, decimal_places=2)
+        return self.update(
+            current_borrow_limit=models.Case(
+                *[
+                    models.When(
+                        credit_score__gte=threshold,
+                        then=models.ExpressionWrapper(base_limit * models.Value(multiplier), output_field=money),
+                    )
+                    for threshold, multiplier in _LIMIT_MULTIPLIERS
+                ],
+                default=models.ExpressionWrapper(base_limit * models.Value(_DEFAULT_LIMIT_MULTIPLIER), output_field=money),
+                output_field=money,
+            ),
+            updated_at=Now(),
+        )
+
+    def with_loan_eligibility(self):
+        """
+        Annotate each customer with is_eligible, the SQL form of can_apply_for_loan().
+        
+        Use it when listing or filtering customers by eligibility, so the check
+        runs in the query instead of once per row in Python.
+        """
+        return self.annotate(
+            # Case rather than a bare Q so customers without a KYC row get False, not NULL
+            is_eligible=models.Case(
+                models.When(
+                    approval_status='approved',
+                    assigned_staff__isnull=False,
+                    kyc_verification__fully_verified=True,
+                    then=models.Value(True),
+                ),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            )
+        )
 
 
 class Customer(models.Model):
@@ -302,14 +521,14 @@ class Customer(models.Model):
     )
     
     # Verification tier affects borrowing limits and available services
-    tier = models.IntegerField(
+    tier = models.PositiveSmallIntegerField(
         choices=TIER_CHOICES, 
         default=1,
         help_text="Customer verification tier (1-4) determining borrowing limits"
     )
     
     # Credit score for risk assessment and loan approval
-    credit_score = models.IntegerField(
+    credit_score = models.PositiveSmallIntegerField(
         default=300, 
         validators=[MinValueValidator(300), MaxValueValidator(850)],
         help_text="Customer credit score (300-850) used for loan risk assessment"
@@ -388,7 +607,8 @@ class Customer(models.Model):
     
     # Audit timestamps
     created_at = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the customer account was created"
     )
     updated_at = models.DateTimeField(
@@ -396,6 +616,25 @@ class Customer(models.Model):
         help_text="Timestamp when the customer account was last updated"
     )
 
+    objects = CustomerQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['approval_status']),
+            models.Index(fields=['assigned_staff', 'approval_status']),
+        ]
+        # Enforced by the database too, since bulk_update() and update() skip field validators
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(credit_score__gte=300, credit_score__lte=850),
+                name='customer_credit_score_range',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(current_borrow_limit__gte=0),
+                name='customer_borrow_limit_non_negative',
+            ),
+        ]
+
     def save(self, *args, **kwargs):
         """
         Override save method to auto-generate account number and set borrowing limit.
@@ -406,31 +645,60 @@ class Customer(models.Model):
         Args:
             *args: Variable length argument list
             **kwargs: Arbitrary keyword arguments
+            
+        Note:
+            Methods that change a few columns on an existing customer save
+            with update_fields so the rest of the row is not rewritten.
         """
-        if not self.account_number:
-            self.account_number = self.generate_account_number()
-        if not self.current_borrow_limit:
+        if self._state.adding and not self.current_borrow_limit:
             self.current_borrow_limit = self.get_base_limit_for_tier()
-        super().save(*args, **kwargs)
+        if self._state.adding and not self.account_number:
+            self._insert_with_account_number(*args, **kwargs)
+        else:
+            if not self.account_number:
+                # Backfill rows created without one (e.g. via bulk_create)
+                self.account_number = self.generate_account_number()
+            super().save(*args, **kwargs)
+        self._clear_eligibility_cache()
+
+    def _clear_eligibility_cache(self):
+        """Drop the cached loan eligibility; called after approval, KYC or assignment changes."""
+        self.__dict__.pop('is_eligible_for_loan', None)
+
+    def _insert_with_account_number(self, *args, **kwargs):
+        """
+        Insert the customer under a fresh account number, relying on the unique constraint.
+        
+        Collisions in a 10-digit space are rare enough that checking first costs
+        more than the occasional retry, so a clash just draws a new number.
+        """
+        for attempt in range(_ACCOUNT_NUMBER_ATTEMPTS):
+            self.account_number = self.generate_account_number()
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                # Only retry clashes on account_number; anything else is a real error
+                last_attempt = attempt == _ACCOUNT_NUMBER_ATTEMPTS - 1
+                if last_attempt or not Customer.objects.filter(account_number=self.account_number).exists():
+                    raise
 
     def generate_account_number(self):
         """
-        Generate a unique 10-digit account number for the customer.
+        Generate a candidate 10-digit account number for the customer.
         
-        This method creates a random 10-digit account number and ensures
-        it's unique by checking against existing customer accounts.
+        This method draws a random 10-digit account number. Uniqueness is
+        enforced by the database when the customer is inserted (see save()).
         
         Returns:
-            str: A unique 10-digit account number
+            str: A random 10-digit account number
             
         Example:
             >>> customer.generate_account_number()
             '1234567890'
         """
-        while True:
-            account_number = ''.join(random.choices(string.digits, k=10))
-            if not Customer.objects.filter(account_number=account_number).exists():
-                return account_number
+        return f'{secrets.randbelow(10_000_000_000):010d}'
 
     def get_base_limit_for_tier(self):
         """
@@ -453,13 +721,7 @@ class Customer(models.Model):
             >>> customer.get_base_limit_for_tier()
             Decimal('2000000.00')
         """
-        tier_limits = {
-            1: Decimal('200000.00'),
-            2: Decimal('500000.00'), 
-            3: Decimal('2000000.00'),
-            4: Decimal('5000000.00'),
-        }
-        return tier_limits.get(self.tier, Decimal('0.00'))
+        return _TIER_LIMITS.get(self.tier, _NO_LIMIT)
 
     def calculate_credit_score(self):
         """
@@ -485,60 +747,24 @@ class Customer(models.Model):
             >>> customer.calculate_credit_score()
             675
         """
-        loans = self.loans.all()
-        if not loans:
-            return 300  # Base score
-        
-        score = 300  # Base score
-        total_loans = loans.count()
-        on_time_payments = 0
-        late_payments = 0
-        total_amount = Decimal('0.00')
-        
-        for loan in loans:
-            total_amount += loan.amount
-            payments = loan.payments.all()
-            
-            for payment in payments:
-                if payment.is_on_time():
-                    on_time_payments += 1
-                else:
-                    late_payments += 1
-        
-        # On-time payment factor (+150 max)
-        if on_time_payments + late_payments > 0:
-            on_time_ratio = on_time_payments / (on_time_payments + late_payments)
-            score += int(on_time_ratio * 150)
-        
-        # Loan history length factor (+50 max)
-        if total_loans > 0:
-            history_factor = min(total_loans * 10, 50)
-            score += history_factor
-        
-        # Tier level factor (+100 max)
-        tier_factor = self.tier * 25
-        score += tier_factor
-        
-        # Late payment penalty (-200 max)
-        if late_payments > 0:
-            penalty = min(late_payments * 20, 200)
-            score -= penalty
-        
-        return min(max(score, 300), 850)  # Keep between 300-850
+        stats = self.loans.aggregate(**_CREDIT_STATS)
+        return _credit_score_from(stats, self.tier)
 
     def update_credit_score(self):
         """
         Update the customer's credit score and save the changes.
         
         This method recalculates the credit score using the current loan
-        performance data and updates the customer record in the database.
+        performance data and writes only credit_score (and updated_at).
         
         Example:
             >>> customer.update_credit_score()
             # Credit score updated and saved to database
         """
-        self.credit_score = self.calculate_credit_score()
-        self.save()
+        credit_score = self.calculate_credit_score()
+        if credit_score != self.credit_score:
+            self.credit_score = credit_score
+            self.save(update_fields=['credit_score', 'updated_at'])
 
     def update_borrow_limit(self):
         """
@@ -546,6 +772,7 @@ class Customer(models.Model):
         
         This method calculates a new borrowing limit by applying a performance
         multiplier to the base tier limit based on the customer's credit score.
+        Only current_borrow_limit (and updated_at) is written.
         
         Performance Multipliers:
             - Credit score >= 750: 1.5x base limit
@@ -560,20 +787,79 @@ class Customer(models.Model):
             >>> customer.current_borrow_limit
             Decimal('2600000.00')  # ₦2,000,000 * 1.3
         """
-        base_limit = self.get_base_limit_for_tier()
+        borrow_limit = self.get_base_limit_for_tier() * _multiplier_for(self.credit_score)
+        if borrow_limit != self.current_borrow_limit:
+            self.current_borrow_limit = borrow_limit
+            self.save(update_fields=['current_borrow_limit', 'updated_at'])
+
+    def recompute_credit_and_limit(self):
+        """
+        Recalculate the credit score and borrowing limit and save both in one UPDATE.
         
-        # Performance multiplier based on credit score
-        if self.credit_score >= 750:
-            multiplier = Decimal('1.5')
-        elif self.credit_score >= 650:
-            multiplier = Decimal('1.3')
-        elif self.credit_score >= 550:
-            multiplier = Decimal('1.1')
-        else:
-            multiplier = Decimal('0.8')
+        Prefer this over calling update_credit_score() followed by
+        update_borrow_limit(), which writes the row twice. Nothing is written
+        when neither value changed.
         
-        self.current_borrow_limit = base_limit * multiplier
-        self.save()
+        Example:
+            >>> customer.recompute_credit_and_limit()
+            # credit_score and current_borrow_limit updated in a single query
+        """
+        credit_score = self.calculate_credit_score()
+        borrow_limit = self.get_base_limit_for_tier() * _multiplier_for(credit_score)
+        
+        changed = []
+        if credit_score != self.credit_score:
+            self.credit_score = credit_score
+            changed.append('credit_score')
+        if borrow_limit != self.current_borrow_limit:
+            self.current_borrow_limit = borrow_limit
+            changed.append('current_borrow_limit')
+        if changed:
+            self.save(update_fields=[*changed, 'updated_at'])
+
+    @classmethod
+    def bulk_recompute(cls, customer_ids, batch_size=1000):
+        """
+        Recalculate credit scores and borrowing limits for many customers at once.
+        
+        Loan and payment counts for every customer come from one grouped
+        aggregate, and the results are written back with bulk_update, so the
+        query count does not grow with the number of customers.
+        
+        Args:
+            customer_ids: Primary keys of the customers to refresh
+            batch_size (int): Rows per UPDATE statement
+            
+        Returns:
+            int: Number of customers updated
+            
+        Example:
+            >>> Customer.bulk_recompute(Customer.objects.values_list('id', flat=True))
+            1200
+        """
+        customer_ids = list(customer_ids)
+        stats_by_customer = {
+            row['customer_id']: row
+            for row in Loan.objects.filter(customer_id__in=customer_ids)
+            .order_by()
+            .values('customer_id')
+            .annotate(**_CREDIT_STATS)
+        }
+        no_loans = {'total_loans': 0, 'total_payments': 0, 'on_time_payments': 0}
+        now = timezone.now()
+        
+        customers = list(
+            cls.objects.filter(pk__in=customer_ids).only('id', 'tier', 'credit_score', 'current_borrow_limit', 'updated_at')
+        )
+        for customer in customers:
+            customer.credit_score = _credit_score_from(stats_by_customer.get(customer.pk, no_loans), customer.tier)
+            customer.current_borrow_limit = customer.get_base_limit_for_tier() * _multiplier_for(customer.credit_score)
+            # bulk_update skips auto_now, so stamp it here
+            customer.updated_at = now
+        
+        return cls.objects.bulk_update(
+            customers, ['credit_score', 'current_borrow_limit', 'updated_at'], batch_size=batch_size
+        )
 
     def is_kyc_verified(self):
         """
@@ -582,10 +868,8 @@ class Customer(models.Model):
         Returns:
             bool: True if KYC is fully verified, False otherwise
         """
-        try:
-            return self.kyc_verification.is_fully_verified()
-        except KYCVerification.DoesNotExist:
-            return False
+        kyc = getattr(self, 'kyc_verification', None)
+        return kyc is not None and kyc.is_fully_verified()
 
     def is_account_approved(self):
         """
@@ -596,24 +880,34 @@ class Customer(models.Model):
         """
         return self.approval_status == 'approved'
 
-    def can_apply_for_loan(self):
+    @cached_property
+    def is_eligible_for_loan(self):
         """
-        Check if the customer is eligible to apply for loans.
+        Whether the customer is eligible to apply for loans.
         
         A customer can apply for loans if:
         - Their account is approved
         - They have completed KYC verification
         - They are assigned to a staff member
         
-        Returns:
-            bool: True if eligible for loan application, False otherwise
+        The result is cached on the instance and cleared whenever the customer
+        or its KYC record is saved.
         """
         return (
             self.is_account_approved() and 
             self.is_kyc_verified() and 
-            self.assigned_staff is not None
+            self.assigned_staff_id is not None
         )
 
+    def can_apply_for_loan(self):
+        """
+        Check if the customer is eligible to apply for loans.
+        
+        Returns:
+            bool: True if eligible for loan application, False otherwise
+        """
+        return self.is_eligible_for_loan
+
     def get_kyc_status(self):
         """
         Get the current KYC verification status.
@@ -621,10 +915,8 @@ class Customer(models.Model):
         Returns:
             str: KYC verification status or 'not_started' if no KYC record exists
         """
-        try:
-            return self.kyc_verification.verification_status
-        except KYCVerification.DoesNotExist:
-            return 'not_started'
+        kyc = getattr(self, 'kyc_verification', None)
+        return kyc.verification_status if kyc is not None else 'not_started'
 
     def assign_to_staff(self, staff_member, assigned_by_user):
         """
@@ -636,16 +928,17 @@ class Customer(models.Model):
         
         Raises:
             ValueError: If staff_member is not a valid staff role
+            
+        Only the assignment columns are written.
         """
-        from django.utils import timezone
-        
         if staff_member.role not in ['manager', 'relationship_officer', 'account_officer']:
             raise ValueError("Staff member must have a valid staff role")
         
         self.assigned_staff = staff_member
         self.assigned_by = assigned_by_user
         self.assigned_date = timezone.now()
-        self.save()
+        self.save(update_fields=['assigned_staff', 'assigned_by', 'assigned_date', 'updated_at'])
+        self._clear_eligibility_cache()
 
     def __str__(self):
         """
@@ -697,6 +990,7 @@ class Document(models.Model):
         ('bank_statement', 'Bank Statement'),
         ('business_license', 'Business License'),
     ]
+    _DOCUMENT_TYPE_LABELS = dict(DOCUMENT_TYPES)
 
     # Customer who owns this document
     customer = models.ForeignKey(
@@ -721,7 +1015,8 @@ class Document(models.Model):
     
     # Upload timestamp
     uploaded_at = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the document was uploaded"
     )
     
@@ -753,7 +1048,41 @@ class Document(models.Model):
             >>> str(document)
             'John Doe - ID Card'
         """
-        return f"{self.customer.user.get_full_name()} - {self.get_document_type_display()}"
+        return f"{self.customer.user.get_full_name()} - {self._DOCUMENT_TYPE_LABELS.get(self.document_type, self.document_type)}"
+
+
+class LoanQuerySet(models.QuerySet):
+    def with_balances(self):
+        """
+        Annotate each loan with total_paid, the sum of its completed payments.
+        
+        get_outstanding_balance() uses the annotation, so a list of loans
+        needs one grouped query rather than one aggregate per loan.
+        """
+        return self.annotate(
+            total_paid=Coalesce(
+                models.Sum('payments__amount', filter=models.Q(payments__status='completed')),
+                models.Value(Decimal('0.00')),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2),
+            )
+        )
+
+    def with_parties(self):
+        """Join the customer's user and the requesting and approving staff read by __str__ and list views."""
+        return self.select_related('customer__user', 'requested_by', 'approved_by')
+
+    def with_completed_payments(self):
+        """
+        Prefetch completed payments into completed_payments.
+        
+        get_outstanding_balance() sums these instead of running its own
+        aggregate, so list views can report balances without a query per loan.
+        """
+        completed = Payment.objects.filter(status='completed')
+        return self.prefetch_related(
+            models.Prefetch('payments', queryset=completed, to_attr='completed_payments')
+        )
+
 
 class Loan(models.Model):
     """
@@ -879,7 +1208,8 @@ class Loan(models.Model):
     
     # Audit timestamps
     created_at = models.DateTimeField(
-        auto_now_add=True,
+        db_default=Now(),
+        editable=False,
         help_text="Timestamp when the loan application was created"
     )
     updated_at = models.DateTimeField(
@@ -887,37 +1217,111 @@ class Loan(models.Model):
         help_text="Timestamp when the loan was last updated"
     )
 
+    objects = LoanQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'customer']),
+            models.Index(fields=['customer', 'created_at']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['status', 'due_date']),
+            # Lets list pages filtered by status be answered from the index alone (PostgreSQL)
+            models.Index(
+                fields=['status'],
+                include=['amount', 'due_date', 'customer'],
+                name='loanpro_loan_status_covering',
+            ),
+        ]
+
     def save(self, *args, **kwargs):
         if self.status == 'disbursed' and not self.due_date:
-            self.due_date = (datetime.now() + timedelta(days=30 * self.duration_months)).date()
+            self.due_date = timezone.localdate() + timedelta(days=30 * self.duration_months)
         super().save(*args, **kwargs)
+        self._clear_payment_cache()
+
+    def _clear_payment_cache(self):
+        """Drop cached repayment figures; call after changing amount, rate or duration."""
+        self.__dict__.pop('monthly_payment', None)
+        self.__dict__.pop('total_amount', None)
+
+    @cached_property
+    def monthly_payment(self):
+        """Monthly payment amount, computed once per instance (see _clear_payment_cache)"""
+        # Every path rounds to kobo so totals match the 2dp payment schedule
+        if self.duration_months == 0:
+            payment = Decimal(self.amount)
+        elif self.interest_rate == 0:
+            payment = Decimal(self.amount) / self.duration_months
+        else:
+            # Float amortization is accurate well below a kobo at these magnitudes and
+            # avoids arbitrary-precision Decimal pow; round to money once at the end
+            rate = float(self.interest_rate / Decimal('100') / Decimal('12'))
+            growth = (1 + rate) ** self.duration_months
+            payment = Decimal(repr(float(self.amount) * rate * growth / (growth - 1)))
+        return payment.quantize(_KOBO, rounding=ROUND_HALF_UP)
+
+    @cached_property
+    def total_amount(self):
+        """Total amount to be repaid, computed once per instance"""
+        return self.monthly_payment * self.duration_months
 
     def calculate_monthly_payment(self):
         """Calculate monthly payment amount"""
-        if self.duration_months == 0:
-            return self.amount
-        
-        monthly_rate = self.interest_rate / Decimal('100') / Decimal('12')
-        if monthly_rate == 0:
-            return self.amount / self.duration_months
-        
-        payment = (self.amount * monthly_rate * (1 + monthly_rate) ** self.duration_months) / \
-                 ((1 + monthly_rate) ** self.duration_months - 1)
-        return payment
+        return self.monthly_payment
 
     def get_total_amount(self):
         """Get total amount to be repaid"""
-        return self.calculate_monthly_payment() * self.duration_months
+        return self.total_amount
 
     def get_outstanding_balance(self):
         """Calculate outstanding balance"""
-        total_paid = self.payments.filter(status='completed').aggregate(
-            total=models.Sum('amount'))['total'] or Decimal('0.00')
+        # Annotated by Loan.objects.with_balances()
+        total_paid = getattr(self, 'total_paid', None)
+        if total_paid is None:
+            if hasattr(self, 'completed_payments'):
+                # Prefetched by Loan.objects.with_completed_payments()
+                total_paid = sum((payment.amount for payment in self.completed_payments), Decimal('0.00'))
+            else:
+                total_paid = self.payments.filter(status='completed').aggregate(
+                    total=models.Sum('amount'))['total'] or Decimal('0.00')
         return self.get_total_amount() - total_paid
 
     def __str__(self):
         return f"Loan {self.id} - {self.customer.account_number} - ₦{self.amount}"
 
+
+class PaymentQuerySet(models.QuerySet):
+    def with_parties(self):
+        """Join the loan, its customer and user read by __str__ and list views."""
+        return self.select_related('loan__customer__user')
+
+    def with_overdue(self, today=None):
+        """
+        Annotate each payment with days_overdue_db, the SQL form of days_overdue().
+        
+        days_overdue() returns the annotation when present, so payment lists
+        get the value from the query instead of computing it per row.
+        """
+        if today is None:
+            today = timezone.localdate()
+        return self.annotate(
+            days_overdue_db=models.Case(
+                models.When(
+                    status='completed',
+                    paid_date__gt=models.F('due_date'),
+                    then=models.F('paid_date') - models.F('due_date'),
+                ),
+                models.When(
+                    status__in=['pending', 'overdue'],
+                    due_date__lt=today,
+                    then=models.Value(today, output_field=models.DateField()) - models.F('due_date'),
+                ),
+                default=models.Value(timedelta(0)),
+                output_field=models.DurationField(),
+            )
+        )
+
+
 class Payment(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -933,7 +1337,20 @@ class Payment(models.Model):
     paid_date = models.DateField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     is_partial = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = PaymentQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['loan', 'status']),
+            models.Index(fields=['status', 'due_date']),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # The with_overdue() annotation reflects the row as it was loaded
+        self.__dict__.pop('days_overdue_db', None)
 
     def is_on_time(self):
         """Check if payment was made on time"""
@@ -941,13 +1358,23 @@ class Payment(models.Model):
             return self.paid_date <= self.due_date
         return False
 
-    def days_overdue(self):
-        """Calculate days overdue"""
+    def days_overdue(self, today=None):
+        """
+        Calculate days overdue.
+        
+        Pass today (a date) when checking many payments so it is computed once.
+        """
+        # Annotated by Payment.objects.with_overdue()
+        overdue = getattr(self, 'days_overdue_db', None)
+        if overdue is not None:
+            return overdue.days
+        
         if self.status == 'completed' and self.paid_date:
             if self.paid_date > self.due_date:
                 return (self.paid_date - self.due_date).days
         elif self.status in ['pending', 'overdue']:
-            today = datetime.now().date()
+            if today is None:
+                today = timezone.localdate()
             if today > self.due_date:
                 return (today - self.due_date).days
         return 0
@@ -960,10 +1387,10 @@ class OTPVerification(models.Model):
     otp_code = models.CharField(max_length=6)
     is_verified = models.BooleanField(default=False)
     expires_at = models.DateTimeField()
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
 
     def is_expired(self):
-        return datetime.now() > self.expires_at
+        return timezone.now() > self.expires_at
 
     def __str__(self):
         return f"OTP for {self.phone_number} - {self.otp_code}"
@@ -983,8 +1410,14 @@ class AuditLog(models.Model):
     model_name = models.CharField(max_length=50)
     object_id = models.CharField(max_length=100)
     details = models.JSONField(default=dict)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(db_default=Now(), editable=False)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['model_name', 'object_id']),
+            models.Index(fields=['-timestamp']),
+        ]
+
     def __str__(self):
         return f"{self.user} - {self.action} - {self.model_name} - {self.timestamp}"
\ No newline at end of file
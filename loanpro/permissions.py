@@ -1,26 +1,37 @@
 # permissions.py
 from rest_framework import permissions
 
-class IsAdmin(permissions.BasePermission):
+# Staff roles with access to every customer's data
+ADMIN_STAFF = frozenset({'admin', 'account_officer'})
+
+
+def HasRole(*roles):
+    """
+    Build a permission class that only allows authenticated users with one of the given roles.
+    """
+    allowed = frozenset(roles)
+
+    class _HasRole(permissions.BasePermission):
+        def has_permission(self, request, view):
+            return request.user.is_authenticated and request.user.role in allowed
+
+    return _HasRole
+
+
+class IsAdmin(HasRole('admin')):
     """
     Custom permission to only allow admin users.
     """
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == 'admin'
 
-class IsAccountOfficer(permissions.BasePermission):
+class IsAccountOfficer(HasRole('account_officer')):
     """
     Custom permission to only allow account officers.
     """
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == 'account_officer'
 
-class IsCustomer(permissions.BasePermission):
+class IsCustomer(HasRole('customer')):
     """
     Custom permission to only allow customers.
     """
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == 'customer'
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """
@@ -47,7 +58,7 @@ class CanAccessCustomerData(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         user = request.user
         
-        if user.role in ['admin', 'account_officer']:
+        if user.role in ADMIN_STAFF:
             return True
         elif user.role == 'customer':
             # Customer can only access their own data
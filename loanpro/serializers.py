@@ -23,12 +23,155 @@ Serializers included:
 - AuditLogSerializer: Audit trail
 """
 
+import copy
+import re
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from .models import User, Customer, Document, Loan, Payment, OTPVerification, AuditLog, KYCVerification
-import random
-from datetime import datetime, timedelta
+import secrets
+from datetime import timedelta
+from functools import lru_cache
+from django.utils import timezone
+
+
+def _choice_labels(model, field_name):
+    """Return a value -> label dict for a model field's choices."""
+    return dict(model._meta.get_field(field_name).flatchoices)
+
+
+_NON_DIGIT_RE = re.compile(r'\D')
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+
+def _phone_digits(value):
+    """
+    Strip every non-digit from a phone number, like re.sub(r'\D', '', value).
+    ASCII input (the normal case) goes through str.translate; anything else
+    falls back to the regex so Unicode digits are handled the same way.
+    """
+    if value.isascii():
+        return value.translate(_ASCII_NON_DIGITS)
+    return _NON_DIGIT_RE.sub('', value)
+
+
+def _validate_11_digits(value, label):
+    """
+    Check that a BVN/NIN is exactly 11 digits (blank values pass).
+    
+    Raises:
+        ValidationError: Naming the label, for non-digits or the wrong length
+    """
+    if not value or (len(value) == 11 and value.isdigit()):
+        return value
+    if not value.isdigit():
+        raise serializers.ValidationError(f"{label} must contain only digits.")
+    raise serializers.ValidationError(f"{label} must be exactly 11 digits.")
+
+
+_USER_LOOKUP_FIELDS = ('username', 'email', 'phone_number')
+
+# Duplicate-account messages used by both registration serializers
+_DUPLICATE_USER_MESSAGES = {
+    'username': "A user with that username already exists.",
+    'email': "User with this email already exists.",
+    'phone_number': "User with this phone number already exists.",
+}
+
+
+def _taken_user_fields(username, email, phone_number):
+    """
+    Return which of username, email and phone_number already belong to a user.
+    
+    All three are checked in a single query; the result is ordered like
+    _USER_LOOKUP_FIELDS.
+    """
+    values = (username, email, phone_number)
+    rows = User.objects.filter(
+        Q(username=username) | Q(email=email) | Q(phone_number=phone_number)
+    ).values_list(*_USER_LOOKUP_FIELDS)
+    
+    taken = set()
+    for row in rows:
+        taken.update(field for field, existing, value in zip(_USER_LOOKUP_FIELDS, row, values) if existing == value)
+    return [field for field in _USER_LOOKUP_FIELDS if field in taken]
+
+
+def _duplicate_user_errors(attrs):
+    """Map each registration field already in use to its duplicate-account message."""
+    taken = _taken_user_fields(attrs['username'], attrs['email'], attrs['phone_number'])
+    return {field: [_DUPLICATE_USER_MESSAGES[field]] for field in taken}
+
+
+@lru_cache(maxsize=None)
+def _unbound_readable_fields_for(serializer_class):
+    """
+    Unbound readable fields of serializer_class, built once per class so a
+    response skips the ModelSerializer model introspection. Never bind these;
+    _readable_fields_for() hands each serializer its own copies.
+    """
+    return tuple(
+        (name, field) for name, field in serializer_class().get_fields().items()
+        if not field.write_only
+    )
+
+
+def _readable_fields_for(serializer):
+    """
+    Copies of the class's cached readable fields, bound to this serializer so
+    they see its context (request included). Built once per serializer, which
+    for many=True is once per response.
+    """
+    fields = serializer.__dict__.get('_cached_readable_fields')
+    if fields is None:
+        fields = []
+        for name, field in _unbound_readable_fields_for(type(serializer)):
+            field = copy.deepcopy(field)
+            field.bind(name, serializer)
+            fields.append(field)
+        serializer._cached_readable_fields = fields
+    return fields
+
+
+def _represent_with_accessors(serializer, instance, accessors):
+    """
+    Serializer.to_representation, but fields named in accessors are read by
+    calling accessors[name](instance) instead of going through
+    field.get_attribute(), which re-resolves the dotted source and checks for
+    callables on every row. An AttributeError from an accessor (e.g. a null
+    relation) drops the field, as DRF does for read-only fields.
+    
+    Serializers that set Meta.cache_fields = True read their fields from
+    _readable_fields_for().
+    """
+    if getattr(serializer.Meta, 'cache_fields', False):
+        fields = _readable_fields_for(serializer)
+    else:
+        fields = serializer._readable_fields
+    ret = {}
+    for field in fields:
+        accessor = accessors.get(field.field_name)
+        try:
+            if accessor is None:
+                attribute = field.get_attribute(instance)
+            else:
+                attribute = accessor(instance)
+        except SkipField:
+            continue
+        except AttributeError:
+            if accessor is None:
+                raise
+            continue
+        check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+        if check_for_none is None:
+            ret[field.field_name] = None
+        else:
+            ret[field.field_name] = field.to_representation(attribute)
+    return ret
 
 class UserSerializer(serializers.ModelSerializer):
     """
@@ -147,6 +290,25 @@ class CustomerDetailSerializer(serializers.ModelSerializer):
                  'documents', 'created_at', 'updated_at']
         read_only_fields = ['id', 'account_number', 'credit_score', 'current_borrow_limit', 
                           'created_at', 'updated_at', 'created_by']
+        cache_fields = True
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the user, creator and documents that to_representation reads."""
+        return queryset.select_related('user', 'created_by').prefetch_related('documents__uploaded_by')
+    
+    _TIER_LABELS = _choice_labels(Customer, 'tier')
+    _ACCOUNT_TYPE_LABELS = _choice_labels(Customer, 'account_type')
+    _ACCESSORS = {
+        'created_by_name': lambda customer: customer.created_by.get_full_name(),
+        'tier_display': lambda customer, labels=_TIER_LABELS: labels.get(customer.tier, customer.tier),
+        'account_type_display': lambda customer, labels=_ACCOUNT_TYPE_LABELS: labels.get(
+            customer.account_type, customer.account_type
+        ),
+    }
+    
+    def to_representation(self, instance):
+        return _represent_with_accessors(self, instance, self._ACCESSORS)
 
 class CustomerCreateSerializer(serializers.ModelSerializer):
     """
@@ -266,7 +428,7 @@ class CustomerCreateSerializer(serializers.ModelSerializer):
         
     def validate_username(self, value):
         """
-        Validate username uniqueness and format.
+        Validate username format (uniqueness is checked in validate()).
         
         Args:
             value (str): Username to validate
@@ -275,13 +437,8 @@ class CustomerCreateSerializer(serializers.ModelSerializer):
             str: Validated username
             
         Raises:
-            ValidationError: If username exists or format is invalid
+            ValidationError: If username format is invalid
         """
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError(
-                f"Username '{value}' is already taken. Please choose a different username."
-            )
-        
         if not value.replace('_', '').replace('-', '').isalnum():
             raise serializers.ValidationError(
                 "Username can only contain letters, numbers, underscores, and hyphens."
@@ -289,28 +446,9 @@ class CustomerCreateSerializer(serializers.ModelSerializer):
         
         return value
     
-    def validate_email(self, value):
-        """
-        Validate email uniqueness.
-        
-        Args:
-            value (str): Email to validate
-            
-        Returns:
-            str: Validated email
-            
-        Raises:
-            ValidationError: If email already exists
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                f"Email address '{value}' is already registered."
-            )
-        return value
-    
     def validate_phone_number(self, value):
         """
-        Validate phone number format.
+        Validate phone number format (uniqueness is checked in validate()).
         
         Args:
             value (str): Phone number to validate
@@ -321,22 +459,14 @@ class CustomerCreateSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: If phone number format is invalid
         """
-        import re
-        
         # Remove all non-digit characters for validation
-        digits_only = re.sub(r'\D', '', value)
+        digits_only = _phone_digits(value)
         
         if len(digits_only) < 10 or len(digits_only) > 15:
             raise serializers.ValidationError(
                 "Phone number must contain between 10 and 15 digits."
             )
         
-        # Check if phone number already exists
-        if User.objects.filter(phone_number=value).exists():
-            raise serializers.ValidationError(
-                "Phone number is already registered."
-            )
-        
         # Basic format validation (should start with + for international)
         if not value.startswith('+') and len(digits_only) > 10:
             raise serializers.ValidationError(
@@ -356,18 +486,28 @@ class CustomerCreateSerializer(serializers.ModelSerializer):
             dict: Validated attributes
             
         Raises:
-            ValidationError: If required fields are missing
+            ValidationError: If the username, email or phone number is already registered
         """
-        required_fields = ['username', 'password', 'email', 'first_name', 'last_name', 'phone_number']
-        missing_fields = [field for field in required_fields if not attrs.get(field)]
-        
-        if missing_fields:
-            raise serializers.ValidationError({
-                'non_field_errors': f"Missing required fields: {', '.join(missing_fields)}"
-            })
+        errors = self._credential_conflicts(attrs['username'], attrs['email'], attrs['phone_number'])
+        if errors:
+            raise serializers.ValidationError(errors)
         
         return attrs
     
+    def _credential_conflicts(self, username, email, phone_number):
+        """
+        Check username, email and phone number uniqueness in a single query.
+        
+        Returns:
+            dict: Field name -> error messages for every value already registered
+        """
+        messages = {
+            'username': f"Username '{username}' is already taken. Please choose a different username.",
+            'email': f"Email address '{email}' is already registered.",
+            'phone_number': "Phone number is already registered.",
+        }
+        return {field: [messages[field]] for field in _taken_user_fields(username, email, phone_number)}
+    
     def create(self, validated_data):
         """
         Create User and Customer records.
@@ -389,11 +529,21 @@ class CustomerCreateSerializer(serializers.ModelSerializer):
             'role': 'customer'
         }
         
-        # Create user
-        user = User.objects.create_user(**user_data)
-        
-        # Create customer
-        customer = Customer.objects.create(user=user, **validated_data)
+        # Create the user and customer together so a failed customer insert
+        # doesn't leave an orphaned user behind
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(**user_data)
+                customer = Customer.objects.create(user=user, **validated_data)
+        except IntegrityError:
+            # Another signup took the username or phone number after validate()
+            # ran; report it the same way validate() would have
+            errors = self._credential_conflicts(
+                user_data['username'], user_data['email'], user_data['phone_number']
+            )
+            if not errors:
+                raise
+            raise serializers.ValidationError(errors)
         
         return customer
 
@@ -448,6 +598,27 @@ class LoanSerializer(serializers.ModelSerializer):
                  'outstanding_balance', 'created_at', 'updated_at']
         read_only_fields = ['id', 'approved_by', 'disbursed_at', 'due_date', 
                           'created_at', 'updated_at']
+        cache_fields = True
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the customer and staff users that to_representation reads."""
+        return queryset.with_parties()
+    
+    _STATUS_LABELS = _choice_labels(Loan, 'status')
+    _ACCESSORS = {
+        'customer': lambda loan: PKOnlyObject(loan.customer_id),
+        'requested_by': lambda loan: PKOnlyObject(loan.requested_by_id),
+        'approved_by': lambda loan: PKOnlyObject(loan.approved_by_id),
+        'customer_name': lambda loan: loan.customer.user.get_full_name(),
+        'customer_account': lambda loan: loan.customer.account_number,
+        'requested_by_name': lambda loan: loan.requested_by.get_full_name(),
+        'approved_by_name': lambda loan: loan.approved_by.get_full_name(),
+        'status_display': lambda loan, labels=_STATUS_LABELS: labels.get(loan.status, loan.status),
+    }
+    
+    def to_representation(self, instance):
+        return _represent_with_accessors(self, instance, self._ACCESSORS)
 
 class LoanCreateSerializer(serializers.ModelSerializer):
     """
@@ -526,6 +697,10 @@ class LoanCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Loan
         fields = ['customer', 'amount', 'interest_rate', 'duration_months']
+        # validate() runs the eligibility checks, so load their relations with the customer
+        extra_kwargs = {
+            'customer': {'queryset': Customer.objects.lean().with_loan_guards()},
+        }
         error_messages = {
             'customer': {
                 'required': 'Customer is required to submit a loan application.',
@@ -591,9 +766,11 @@ class LoanCreateSerializer(serializers.ModelSerializer):
                     'non_field_errors': 'KYC verification is required before applying for loans. Please complete your verification process.'
                 })
         
-        # Check if customer has an active loan
-        active_loan = Loan.objects.filter(customer=customer, status='active').first()
-        if active_loan:
+        # Check if customer has an active loan (annotated by with_loan_guards())
+        has_active_loan = getattr(customer, 'has_active_loan', None)
+        if has_active_loan is None:
+            has_active_loan = Loan.objects.filter(customer=customer, status='active').exists()
+        if has_active_loan:
             raise serializers.ValidationError({
                 'non_field_errors': 'Customer has an active loan. Only one active loan per customer is allowed.'
             })
@@ -652,6 +829,23 @@ class PaymentSerializer(serializers.ModelSerializer):
                  'paid_date', 'status', 'is_partial', 'days_overdue', 'is_on_time',
                  'created_at']
         read_only_fields = ['id', 'created_at']
+        cache_fields = True
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the loan's customer and user that to_representation reads."""
+        return queryset.with_parties()
+    
+    _ACCESSORS = {
+        'loan': lambda payment: PKOnlyObject(payment.loan_id),
+        'loan_id': lambda payment: payment.loan_id,
+        'customer_name': lambda payment: payment.loan.customer.user.get_full_name(),
+        'days_overdue': lambda payment: payment.days_overdue(),
+        'is_on_time': lambda payment: payment.is_on_time(),
+    }
+    
+    def to_representation(self, instance):
+        return _represent_with_accessors(self, instance, self._ACCESSORS)
 
 class OTPSerializer(serializers.Serializer):
     """
@@ -687,24 +881,18 @@ class OTPSerializer(serializers.Serializer):
         phone_number = validated_data['phone_number']
         
         # Generate 6-digit OTP
-        otp_code = str(random.randint(100000, 999999))
+        otp_code = f"{secrets.randbelow(900000) + 100000:06d}"
         
         # Create or update OTP record
-        otp_verification, created = OTPVerification.objects.get_or_create(
+        otp_verification, _ = OTPVerification.objects.update_or_create(
             phone_number=phone_number,
             defaults={
                 'otp_code': otp_code,
-                'expires_at': datetime.now() + timedelta(minutes=10),
+                'expires_at': timezone.now() + timedelta(minutes=10),
                 'is_verified': False
             }
         )
         
-        if not created:
-            otp_verification.otp_code = otp_code
-            otp_verification.expires_at = datetime.now() + timedelta(minutes=10)
-            otp_verification.is_verified = False
-            otp_verification.save()
-        
         return {
             'phone_number': phone_number,
             'otp_code': otp_code,  # In production, don't return this
@@ -785,7 +973,7 @@ class OTPVerifySerializer(serializers.Serializer):
             attrs (dict): Phone number and OTP code
             
         Returns:
-            dict: Validated attributes
+            dict: Validated attributes, with the matched record as otp_instance
             
         Raises:
             ValidationError: If OTP is invalid or expired
@@ -799,7 +987,9 @@ class OTPVerifySerializer(serializers.Serializer):
             })
         
         try:
-            otp_verification = OTPVerification.objects.get(phone_number=phone_number)
+            otp_verification = OTPVerification.objects.only(
+                'phone_number', 'otp_code', 'expires_at', 'is_verified'
+            ).get(phone_number=phone_number)
         except OTPVerification.DoesNotExist:
             raise serializers.ValidationError({
                 'phone_number': 'No OTP found for this phone number. Please request a new OTP.'
@@ -810,48 +1000,18 @@ class OTPVerifySerializer(serializers.Serializer):
                 'non_field_errors': 'Phone number is already verified.'
             })
         
-        if otp_verification.expires_at < datetime.now():
+        if otp_verification.expires_at < timezone.now():
             raise serializers.ValidationError({
                 'non_field_errors': 'OTP has expired. Please request a new code.'
             })
         
-        if otp_verification.otp_code != otp_code:
+        if not secrets.compare_digest(otp_verification.otp_code.encode(), otp_code.encode()):
             raise serializers.ValidationError({
                 'otp_code': 'Invalid OTP code. Please check and try again.'
             })
         
+        attrs['otp_instance'] = otp_verification
         return attrs
-    
-    def validate(self, data):
-        """
-        Mark OTP as verified and update user record.
-        
-        Args:
-            data (dict): Validated data
-            
-        Returns:
-            dict: Verification result
-        """
-        phone_number = data['phone_number']
-        
-        # Mark OTP as verified
-        otp_verification = OTPVerification.objects.get(phone_number=phone_number)
-        otp_verification.is_verified = True
-        otp_verification.save()
-        
-        # Update user's phone verification status
-        try:
-            user = User.objects.get(phone_number=phone_number)
-            user.is_phone_verified = True
-            user.save()
-        except User.DoesNotExist:
-            pass  # User might not exist yet during registration
-        
-        return {
-            'phone_number': phone_number,
-            'is_verified': True,
-            'message': 'Phone number verified successfully'
-        }
 
 class LoginSerializer(serializers.Serializer):
     """
@@ -912,7 +1072,7 @@ class LoginSerializer(serializers.Serializer):
             attrs (dict): Username and password
             
         Returns:
-            dict: Validated attributes with user
+            dict: The authenticated user and a success message
             
         Raises:
             ValidationError: If credentials are invalid
@@ -928,13 +1088,13 @@ class LoginSerializer(serializers.Serializer):
         # Try to authenticate user
         user = authenticate(username=username, password=password)
         
-        if not user:
+        if not user and '@' in username:
             # Try with email as username
-            try:
-                user_obj = User.objects.get(email=username)
-                user = authenticate(username=user_obj.username, password=password)
-            except User.DoesNotExist:
-                pass
+            account_username = User.objects.filter(email=username).order_by('pk').values_list(
+                'username', flat=True
+            ).first()
+            if account_username is not None:
+                user = authenticate(username=account_username, password=password)
         
         if not user:
             raise serializers.ValidationError({
@@ -946,21 +1106,8 @@ class LoginSerializer(serializers.Serializer):
                 'non_field_errors': 'User account is disabled. Please contact support.'
             })
         
-        attrs['user'] = user
-        return attrs
-    
-    def validate(self, data):
-        """
-        Return user data for successful authentication.
-        
-        Args:
-            data (dict): Validated data
-            
-        Returns:
-            dict: User authentication data
-        """
         return {
-            'user': data['user'],
+            'user': user,
             'message': 'Login successful'
         }
 
@@ -985,15 +1132,15 @@ class CreditScoreBreakdownSerializer(serializers.Serializer):
     }
     """
     
-    current_score = serializers.IntegerField()
-    base_score = serializers.IntegerField()
-    on_time_payment_factor = serializers.IntegerField()
-    loan_history_factor = serializers.IntegerField()
-    tier_factor = serializers.IntegerField()
-    late_payment_penalty = serializers.IntegerField()
-    total_loans = serializers.IntegerField()
-    on_time_payments = serializers.IntegerField()
-    late_payments = serializers.IntegerField()
+    current_score = serializers.IntegerField(read_only=True)
+    base_score = serializers.IntegerField(read_only=True)
+    on_time_payment_factor = serializers.IntegerField(read_only=True)
+    loan_history_factor = serializers.IntegerField(read_only=True)
+    tier_factor = serializers.IntegerField(read_only=True)
+    late_payment_penalty = serializers.IntegerField(read_only=True)
+    total_loans = serializers.IntegerField(read_only=True)
+    on_time_payments = serializers.IntegerField(read_only=True)
+    late_payments = serializers.IntegerField(read_only=True)
 
 class DashboardStatsSerializer(serializers.Serializer):
     """
@@ -1014,13 +1161,13 @@ class DashboardStatsSerializer(serializers.Serializer):
     }
     """
     
-    total_customers = serializers.IntegerField()
-    total_loans = serializers.IntegerField()
-    active_loans = serializers.IntegerField()
-    pending_loans = serializers.IntegerField()
-    total_amount_disbursed = serializers.DecimalField(max_digits=15, decimal_places=2)
-    total_amount_collected = serializers.DecimalField(max_digits=15, decimal_places=2)
-    average_credit_score = serializers.DecimalField(max_digits=5, decimal_places=2)
+    total_customers = serializers.IntegerField(read_only=True)
+    total_loans = serializers.IntegerField(read_only=True)
+    active_loans = serializers.IntegerField(read_only=True)
+    pending_loans = serializers.IntegerField(read_only=True)
+    total_amount_disbursed = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
+    total_amount_collected = serializers.DecimalField(max_digits=15, decimal_places=2, read_only=True)
+    average_credit_score = serializers.DecimalField(max_digits=5, decimal_places=2, read_only=True)
 
 class CustomerStatsSerializer(serializers.Serializer):
     """
@@ -1042,14 +1189,14 @@ class CustomerStatsSerializer(serializers.Serializer):
     }
     """
     
-    total_loans = serializers.IntegerField()
-    active_loans = serializers.IntegerField()
-    completed_loans = serializers.IntegerField()
-    total_borrowed = serializers.DecimalField(max_digits=12, decimal_places=2)
-    total_repaid = serializers.DecimalField(max_digits=12, decimal_places=2)
-    outstanding_balance = serializers.DecimalField(max_digits=12, decimal_places=2)
-    next_payment_due = serializers.DateField(allow_null=True)
-    next_payment_amount = serializers.DecimalField(max_digits=12, decimal_places=2, allow_null=True)
+    total_loans = serializers.IntegerField(read_only=True)
+    active_loans = serializers.IntegerField(read_only=True)
+    completed_loans = serializers.IntegerField(read_only=True)
+    total_borrowed = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    total_repaid = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    outstanding_balance = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    next_payment_due = serializers.DateField(allow_null=True, read_only=True)
+    next_payment_amount = serializers.DecimalField(max_digits=12, decimal_places=2, allow_null=True, read_only=True)
 
 class AuditLogSerializer(serializers.ModelSerializer):
     """
@@ -1080,50 +1227,31 @@ class AuditLogSerializer(serializers.ModelSerializer):
         model = AuditLog
         fields = ['id', 'user', 'user_name', 'action', 'action_display', 
                  'model_name', 'object_id', 'details', 'timestamp', 'ip_address']
-        read_only_fields = ['id', 'timestamp']
-
-class CustomerSelfRegistrationSerializer(serializers.ModelSerializer):
-    """
-    Serializer for customer self-registration.
-    
-    Allows customers to register themselves with basic information.
-    Creates both User and Customer records with pending approval status.
-    
-    Example Request:
-    {
-        "username": "johndoe",
-        "password": "SecurePass123!",
-        "email": "john@example.com",
-        "first_name": "John",
-        "last_name": "Doe",
-        "phone_number": "+1234567890",
-        "account_type": "individual",
-        "address": "123 Main St, City, State"
+        # Audit entries are only ever listed, never written through the API
+        read_only_fields = fields
+        cache_fields = True
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the acting user that to_representation reads."""
+        return queryset.select_related('user')
+    
+    _ACTION_LABELS = _choice_labels(AuditLog, 'action')
+    _ACCESSORS = {
+        'user': lambda entry: PKOnlyObject(entry.user_id),
+        'user_name': lambda entry: entry.user.get_full_name(),
+        'action_display': lambda entry, labels=_ACTION_LABELS: labels.get(entry.action, entry.action),
     }
     
-    Example Success Response:
-    {
-        "id": 1,
-        "user": {
-            "id": 1,
-            "username": "johndoe",
-            "email": "john@example.com",
-            "first_name": "John",
-            "last_name": "Doe",
-            "phone_number": "+1234567890"
-        },
-        "account_number": "1234567890",
-        "account_type": "individual",
-        "approval_status": "pending",
-        "message": "Registration successful. Your account is pending approval."
-    }
+    def to_representation(self, instance):
+        return _represent_with_accessors(self, instance, self._ACCESSORS)
+
+class BaseCustomerRegistrationSerializer(serializers.ModelSerializer):
+    """
+    Fields, validation and record creation shared by the customer registration serializers.
     
-    Example Validation Error Response:
-    {
-        "username": ["A user with that username already exists."],
-        "email": ["User with this email already exists."],
-        "phone_number": ["User with this phone number already exists."]
-    }
+    Subclasses declare Meta and create(), passing their approval and
+    assignment columns to _create_customer().
     """
     
     # User fields
@@ -1205,54 +1333,9 @@ class CustomerSelfRegistrationSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     message = serializers.CharField(read_only=True)
 
-    class Meta:
-        model = Customer
-        fields = ['username', 'password', 'email', 'first_name', 'last_name', 
-                 'phone_number', 'account_type', 'address', 'id', 'user', 
-                 'account_number', 'approval_status', 'message']
-        read_only_fields = ['id', 'account_number', 'approval_status']
-
-    def validate_username(self, value):
-        """
-        Validate that the username is unique.
-        
-        Args:
-            value (str): Username to validate
-            
-        Returns:
-            str: Validated username
-            
-        Raises:
-            ValidationError: If username already exists
-        """
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError(
-                "A user with that username already exists."
-            )
-        return value
-
-    def validate_email(self, value):
-        """
-        Validate that the email is unique.
-        
-        Args:
-            value (str): Email to validate
-            
-        Returns:
-            str: Validated email
-            
-        Raises:
-            ValidationError: If email already exists
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                "User with this email already exists."
-            )
-        return value
-
     def validate_phone_number(self, value):
         """
-        Validate that the phone number is unique and properly formatted.
+        Validate that the phone number is properly formatted.
         
         Args:
             value (str): Phone number to validate
@@ -1261,37 +1344,43 @@ class CustomerSelfRegistrationSerializer(serializers.ModelSerializer):
             str: Validated phone number
             
         Raises:
-            ValidationError: If phone number already exists or is invalid
+            ValidationError: If phone number is invalid
         """
-        import re
-        
         # Remove any non-digit characters for validation
-        digits_only = re.sub(r'\D', '', value)
+        digits_only = _phone_digits(value)
         
         if len(digits_only) < 10:
             raise serializers.ValidationError(
                 "Phone number must contain at least 10 digits."
             )
         
-        if User.objects.filter(phone_number=value).exists():
-            raise serializers.ValidationError(
-                "User with this phone number already exists."
-            )
-        
         return value
 
-    def create(self, validated_data):
+    def validate(self, attrs):
         """
-        Create a new customer with self-registration.
+        Validate that the username, email and phone number are not already registered.
         
-        Creates both User and Customer records. The customer account
-        will have pending approval status and no staff assignment.
+        Raises:
+            ValidationError: Listing every field that belongs to an existing user
+        """
+        errors = _duplicate_user_errors(attrs)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def _create_customer(self, validated_data, **customer_fields):
+        """
+        Create the customer's User and Customer records in one transaction.
         
         Args:
             validated_data (dict): Validated registration data
+            **customer_fields: Extra Customer columns, e.g. approval_status
             
         Returns:
-            Customer: Created customer instance with user data
+            Customer: Created customer instance
+            
+        Raises:
+            ValidationError: If the insert hit a unique constraint on an existing user
         """
         # Extract user data
         user_data = {
@@ -1304,17 +1393,90 @@ class CustomerSelfRegistrationSerializer(serializers.ModelSerializer):
         }
         password = validated_data.pop('password')
         
-        # Create user
-        user = User.objects.create_user(
-            password=password,
-            **user_data
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    password=password,
+                    **user_data
+                )
+                return Customer.objects.create(user=user, **customer_fields, **validated_data)
+        except IntegrityError:
+            # A concurrent registration claimed the username or phone number
+            # after validate() ran
+            errors = _duplicate_user_errors(user_data)
+            if not errors:
+                raise
+            raise serializers.ValidationError(errors)
+
+
+class CustomerSelfRegistrationSerializer(BaseCustomerRegistrationSerializer):
+    """
+    Serializer for customer self-registration.
+    
+    Allows customers to register themselves with basic information.
+    Creates both User and Customer records with pending approval status.
+    
+    Example Request:
+    {
+        "username": "johndoe",
+        "password": "SecurePass123!",
+        "email": "john@example.com",
+        "first_name": "John",
+        "last_name": "Doe",
+        "phone_number": "+1234567890",
+        "account_type": "individual",
+        "address": "123 Main St, City, State"
+    }
+    
+    Example Success Response:
+    {
+        "id": 1,
+        "user": {
+            "id": 1,
+            "username": "johndoe",
+            "email": "john@example.com",
+            "first_name": "John",
+            "last_name": "Doe",
+            "phone_number": "+1234567890"
+        },
+        "account_number": "1234567890",
+        "account_type": "individual",
+        "approval_status": "pending",
+        "message": "Registration successful. Your account is pending approval."
+    }
+    
+    Example Validation Error Response:
+    {
+        "username": ["A user with that username already exists."],
+        "email": ["User with this email already exists."],
+        "phone_number": ["User with this phone number already exists."]
+    }
+    """
+
+    class Meta:
+        model = Customer
+        fields = ['username', 'password', 'email', 'first_name', 'last_name', 
+                 'phone_number', 'account_type', 'address', 'id', 'user', 
+                 'account_number', 'approval_status', 'message']
+        read_only_fields = ['id', 'account_number', 'approval_status']
+
+    def create(self, validated_data):
+        """
+        Create a new customer with self-registration.
+        
+        Creates both User and Customer records. The customer account
+        will have pending approval status and no staff assignment.
         
+        Args:
+            validated_data (dict): Validated registration data
+            
+        Returns:
+            Customer: Created customer instance with user data
+        """
         # Create customer with pending approval
-        customer = Customer.objects.create(
-            user=user,
+        customer = self._create_customer(
+            validated_data,
             approval_status='pending',  # Self-registered customers need approval
-            **validated_data
         )
         
         # Add success message
@@ -1323,7 +1485,7 @@ class CustomerSelfRegistrationSerializer(serializers.ModelSerializer):
         return customer
 
 
-class StaffCustomerRegistrationSerializer(serializers.ModelSerializer):
+class StaffCustomerRegistrationSerializer(BaseCustomerRegistrationSerializer):
     """
     Serializer for staff to register customers on their behalf.
     
@@ -1364,74 +1526,7 @@ class StaffCustomerRegistrationSerializer(serializers.ModelSerializer):
     }
     """
     
-    # User fields
-    username = serializers.CharField(
-        write_only=True,
-        min_length=3,
-        max_length=150,
-        error_messages={
-            'required': 'Username is required for registration.',
-            'blank': 'Username cannot be empty.',
-            'min_length': 'Username must be at least 3 characters long.',
-            'max_length': 'Username cannot exceed 150 characters.'
-        }
-    )
-    password = serializers.CharField(
-        write_only=True, 
-        validators=[validate_password],
-        error_messages={
-            'required': 'Password is required for registration.',
-            'blank': 'Password cannot be empty.'
-        }
-    )
-    email = serializers.EmailField(
-        write_only=True,
-        error_messages={
-            'required': 'Email address is required for registration.',
-            'blank': 'Email address cannot be empty.',
-            'invalid': 'Please enter a valid email address.'
-        }
-    )
-    first_name = serializers.CharField(
-        write_only=True,
-        min_length=1,
-        max_length=30,
-        error_messages={
-            'required': 'First name is required for registration.',
-            'blank': 'First name cannot be empty.',
-            'max_length': 'First name cannot exceed 30 characters.'
-        }
-    )
-    last_name = serializers.CharField(
-        write_only=True,
-        min_length=1,
-        max_length=30,
-        error_messages={
-            'required': 'Last name is required for registration.',
-            'blank': 'Last name cannot be empty.',
-            'max_length': 'Last name cannot exceed 30 characters.'
-        }
-    )
-    phone_number = serializers.CharField(
-        write_only=True,
-        min_length=10,
-        max_length=15,
-        error_messages={
-            'required': 'Phone number is required for registration.',
-            'blank': 'Phone number cannot be empty.',
-            'min_length': 'Phone number must be at least 10 digits long.',
-            'max_length': 'Phone number cannot exceed 15 characters.'
-        }
-    )
-    
     # Customer fields
-    account_type = serializers.ChoiceField(
-        choices=Customer.ACCOUNT_TYPE_CHOICES,
-        error_messages={
-            'required': 'Account type is required. Choose either "individual" or "business".',
-            'invalid_choice': 'Account type must be either "individual" or "business".'
-        }
-    )
     tier = serializers.ChoiceField(
         choices=Customer.TIER_CHOICES,
         required=False,
@@ -1439,17 +1534,9 @@ class StaffCustomerRegistrationSerializer(serializers.ModelSerializer):
             'invalid_choice': 'Invalid tier. Choose from: bronze, silver, gold, platinum.'
         }
     )
-    address = serializers.CharField(
-        error_messages={
-            'required': 'Physical address is required for registration.',
-            'blank': 'Address cannot be empty.'
-        }
-    )
     
     # Read-only fields for response
-    user = UserSerializer(read_only=True)
     assigned_staff_name = serializers.CharField(read_only=True)
-    message = serializers.CharField(read_only=True)
 
     class Meta:
         model = Customer
@@ -1459,74 +1546,6 @@ class StaffCustomerRegistrationSerializer(serializers.ModelSerializer):
                  'assigned_staff_name', 'message']
         read_only_fields = ['id', 'account_number', 'approval_status', 'assigned_staff']
 
-    def validate_username(self, value):
-        """
-        Validate that the username is unique.
-        
-        Args:
-            value (str): Username to validate
-            
-        Returns:
-            str: Validated username
-            
-        Raises:
-            ValidationError: If username already exists
-        """
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError(
-                "A user with that username already exists."
-            )
-        return value
-
-    def validate_email(self, value):
-        """
-        Validate that the email is unique.
-        
-        Args:
-            value (str): Email to validate
-            
-        Returns:
-            str: Validated email
-            
-        Raises:
-            ValidationError: If email already exists
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError(
-                "User with this email already exists."
-            )
-        return value
-
-    def validate_phone_number(self, value):
-        """
-        Validate that the phone number is unique and properly formatted.
-        
-        Args:
-            value (str): Phone number to validate
-            
-        Returns:
-            str: Validated phone number
-            
-        Raises:
-            ValidationError: If phone number already exists or is invalid
-        """
-        import re
-        
-        # Remove any non-digit characters for validation
-        digits_only = re.sub(r'\D', '', value)
-        
-        if len(digits_only) < 10:
-            raise serializers.ValidationError(
-                "Phone number must contain at least 10 digits."
-            )
-        
-        if User.objects.filter(phone_number=value).exists():
-            raise serializers.ValidationError(
-                "User with this phone number already exists."
-            )
-        
-        return value
-
     def create(self, validated_data):
         """
         Create a new customer registered by staff.
@@ -1543,38 +1562,16 @@ class StaffCustomerRegistrationSerializer(serializers.ModelSerializer):
         # Get the registering staff member from context
         registering_staff = self.context['request'].user
         
-        # Extract user data
-        user_data = {
-            'username': validated_data.pop('username'),
-            'email': validated_data.pop('email'),
-            'first_name': validated_data.pop('first_name'),
-            'last_name': validated_data.pop('last_name'),
-            'phone_number': validated_data.pop('phone_number'),
-            'role': 'customer'
-        }
-        password = validated_data.pop('password')
-        
-        # Create user
-        user = User.objects.create_user(
-            password=password,
-            **user_data
-        )
-        
         # Create customer with automatic approval and staff assignment
-        customer = Customer.objects.create(
-            user=user,
+        customer = self._create_customer(
+            validated_data,
             approval_status='approved',  # Staff-registered customers are auto-approved
             assigned_staff=registering_staff,
             assigned_by=registering_staff,
+            assigned_date=timezone.now(),
             created_by=registering_staff,
-            **validated_data
         )
         
-        # Set assignment date
-        from django.utils import timezone
-        customer.assigned_date = timezone.now()
-        customer.save()
-        
         # Add success message and staff info
         customer.message = "Customer registered successfully and assigned to you."
         customer.assigned_staff_name = registering_staff.get_full_name()
@@ -1634,6 +1631,7 @@ class KYCVerificationSerializer(serializers.ModelSerializer):
                  'verified_by', 'verified_by_name', 'verification_date', 
                  'verification_notes', 'created_at', 'updated_at']
         read_only_fields = ['id', 'customer', 'verification_progress', 'created_at', 'updated_at']
+        cache_fields = True
         extra_kwargs = {
             'bvn': {
                 'error_messages': {
@@ -1658,6 +1656,21 @@ class KYCVerificationSerializer(serializers.ModelSerializer):
             }
         }
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the customer's user and the verifying staff member that to_representation reads."""
+        return queryset.select_related('customer__user', 'verified_by')
+    
+    _ACCESSORS = {
+        'customer': lambda kyc: PKOnlyObject(kyc.customer_id),
+        'customer_name': lambda kyc: kyc.customer.user.get_full_name(),
+        'verified_by': lambda kyc: PKOnlyObject(kyc.verified_by_id),
+        'verified_by_name': lambda kyc: kyc.verified_by.get_full_name(),
+    }
+    
+    def to_representation(self, instance):
+        return _represent_with_accessors(self, instance, self._ACCESSORS)
+
     def validate_bvn(self, value):
         """
         Validate BVN format.
@@ -1671,13 +1684,7 @@ class KYCVerificationSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: If BVN format is invalid
         """
-        if value and not value.isdigit():
-            raise serializers.ValidationError("BVN must contain only digits.")
-        
-        if value and len(value) != 11:
-            raise serializers.ValidationError("BVN must be exactly 11 digits.")
-        
-        return value
+        return _validate_11_digits(value, 'BVN')
 
     def validate_nin(self, value):
         """
@@ -1692,13 +1699,7 @@ class KYCVerificationSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: If NIN format is invalid
         """
-        if value and not value.isdigit():
-            raise serializers.ValidationError("NIN must contain only digits.")
-        
-        if value and len(value) != 11:
-            raise serializers.ValidationError("NIN must be exactly 11 digits.")
-        
-        return value
+        return _validate_11_digits(value, 'NIN')
 
     def update(self, instance, validated_data):
         """
@@ -1714,8 +1715,6 @@ class KYCVerificationSerializer(serializers.ModelSerializer):
         Returns:
             KYCVerification: Updated KYC instance
         """
-        from django.utils import timezone
-        
         # Update fields
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -1790,7 +1789,7 @@ class CustomerAssignmentSerializer(serializers.Serializer):
             ValidationError: If customer doesn't exist or is not approved
         """
         try:
-            customer = Customer.objects.get(id=value)
+            customer = Customer.objects.lean().get(id=value)
             if customer.approval_status != 'approved':
                 raise serializers.ValidationError(
                     "Customer must be approved before assignment."
@@ -1834,7 +1833,7 @@ class CustomerAssignmentSerializer(serializers.Serializer):
         Returns:
             dict: Assignment result with customer and staff details
         """
-        customer = Customer.objects.get(id=validated_data['customer_id'])
+        customer = Customer.objects.lean().select_related('user').get(id=validated_data['customer_id'])
         staff = User.objects.get(id=validated_data['staff_id'])
         assigned_by_user = self.context['request'].user
         
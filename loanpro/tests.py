@@ -1,3 +1,291 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.db import IntegrityError
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from .models import AuditLog, Customer, KYCVerification, Loan, Payment, User
+from .serializers import CustomerDetailSerializer, LoanSerializer
+
+
+def add_loan(customer, requested_by, *payments):
+    """Create a loan with (due offset, paid offset or None, status) payments, offsets in days."""
+    loan = Loan.objects.create(
+        customer=customer, amount=Decimal('1000.00'), interest_rate=Decimal('5.00'),
+        duration_months=3, requested_by=requested_by,
+    )
+    today = timezone.localdate()
+    for due, paid, status in payments:
+        Payment.objects.create(
+            loan=loan, amount=Decimal('350.00'), status=status,
+            due_date=today + timedelta(days=due),
+            paid_date=None if paid is None else today + timedelta(days=paid),
+        )
+    return loan
+
+
+class LoanFixtureMixin:
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username='admin', password='pass', role='admin', phone_number='08000000001'
+        )
+        borrower = User.objects.create_user(
+            username='borrower', password='pass', role='customer', phone_number='08000000002'
+        )
+        customer = Customer.objects.create(user=borrower)
+        loan = Loan.objects.create(
+            customer=customer, amount=Decimal('1000.00'), interest_rate=Decimal('5.00'),
+            duration_months=1, requested_by=self.admin,
+        )
+        self.payment = Payment.objects.create(
+            loan=loan, amount=Decimal('1050.00'),
+            due_date=timezone.localdate() - timedelta(days=10),
+        )
+
+
+class PaymentUpdateTests(LoanFixtureMixin, APITestCase):
+    def test_patch_reports_fresh_days_overdue(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.patch(
+            f'/api/v1/payments/{self.payment.pk}/',
+            {'due_date': timezone.localdate().isoformat()},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['days_overdue'], 0)
+
+
+class CustomerEligibilityCacheTests(APITestCase):
+    def setUp(self):
+        self.manager = User.objects.create_user(
+            username='manager', password='pass', role='manager', phone_number='08000000003'
+        )
+        borrower = User.objects.create_user(
+            username='applicant', password='pass', role='customer', phone_number='08000000004'
+        )
+        self.customer = Customer.objects.create(user=borrower, approval_status='approved')
+
+    def test_eligibility_refreshes_after_kyc_and_assignment(self):
+        self.assertFalse(self.customer.is_eligible_for_loan)
+
+        KYCVerification.objects.create(
+            customer=self.customer, bvn='12345678901', nin='12345678901',
+            bvn_verified=True, nin_verified=True, verification_status='verified',
+        )
+        self.assertFalse(self.customer.is_eligible_for_loan)
+
+        self.customer.assign_to_staff(self.manager, self.manager)
+        self.assertTrue(self.customer.is_eligible_for_loan)
+
+
+class LoanPartiesTests(LoanFixtureMixin, TestCase):
+    def test_default_managers_do_not_join(self):
+        self.assertNotIn('JOIN', str(Loan.objects.all().query))
+        self.assertNotIn('JOIN', str(self.payment.loan.payments.filter(status='pending').query))
+
+    def test_with_parties_loads_str_relations(self):
+        with self.assertNumQueries(1):
+            str(Payment.objects.with_parties().get(pk=self.payment.pk).loan)
+        with self.assertNumQueries(1):
+            str(Loan.objects.with_parties().get(pk=self.payment.loan_id))
+
+
+class AuditLogExportTests(LoanFixtureMixin, APITestCase):
+    def test_export_streams_requested_page(self):
+        AuditLog.objects.bulk_create(
+            AuditLog(user=self.admin, action='create', model_name='Loan', object_id=str(n))
+            for n in range(5)
+        )
+        self.client.force_authenticate(self.admin)
+        response = self.client.get('/api/v1/audit-logs/export/', {'page_size': 2, 'page': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        body = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(body['metadata']['count'], 5)
+        self.assertEqual(body['metadata']['page'], 2)
+        self.assertEqual(len(body['results']), 2)
+        self.assertEqual(body['results'][0]['user_name'], self.admin.get_full_name())
+
+
+class CachedFieldsTests(LoanFixtureMixin, TestCase):
+    def test_cached_fields_are_bound_per_serializer(self):
+        request = APIRequestFactory().get('/')
+        loan = Loan.objects.get(pk=self.payment.loan_id)
+        first = LoanSerializer(loan, context={'request': request})
+        second = LoanSerializer(loan)
+        self.assertEqual(first.data, second.data)
+
+        first_fields = {field.field_name: field for field in first._cached_readable_fields}
+        second_fields = {field.field_name: field for field in second._cached_readable_fields}
+        self.assertIsNot(first_fields['customer'], second_fields['customer'])
+        self.assertIs(first_fields['customer'].context['request'], request)
+        self.assertNotIn('request', second_fields['customer'].context)
+
+    def test_nested_serializers_see_request_context(self):
+        request = APIRequestFactory().get('/')
+        serializer = CustomerDetailSerializer(self.payment.loan.customer, context={'request': request})
+        serializer.data
+        nested = {field.field_name: field for field in serializer._cached_readable_fields}
+        self.assertIs(nested['user'].context['request'], request)
+        self.assertIs(nested['documents'].context['request'], request)
+
+
+class MonthlyPaymentTests(TestCase):
+    def test_every_path_rounds_to_kobo(self):
+        cases = [
+            (Decimal('100000.00'), Decimal('0.00'), 6, Decimal('16666.67')),
+            (Decimal('100000.00'), Decimal('12.00'), 12, Decimal('8884.88')),
+            (Decimal('2500.005'), Decimal('5.00'), 0, Decimal('2500.01')),
+        ]
+        for amount, rate, months, expected in cases:
+            loan = Loan(amount=amount, interest_rate=rate, duration_months=months)
+            self.assertEqual(loan.monthly_payment, expected)
+            self.assertEqual(loan.monthly_payment.as_tuple().exponent, -2)
+            self.assertEqual(loan.total_amount, expected * months)
+
+
+class CreditScoreTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            username='officer', password='pass', role='manager', phone_number='08000000005'
+        )
+        borrower = User.objects.create_user(
+            username='scored', password='pass', role='customer', phone_number='08000000006'
+        )
+        self.customer = Customer.objects.create(user=borrower, tier=2)
+
+    def add_loan(self, *payments):
+        return add_loan(self.customer, self.staff, *payments)
+
+    def test_no_loans_scores_base(self):
+        self.assertEqual(self.customer.calculate_credit_score(), 300)
+
+    def test_matches_per_payment_is_on_time(self):
+        self.add_loan((-60, -60, 'completed'), (-30, -35, 'completed'), (-10, -5, 'completed'))
+        self.add_loan((-20, None, 'pending'), (-50, -40, 'completed'))
+        self.add_loan()
+
+        payments = Payment.objects.filter(loan__customer=self.customer)
+        on_time = sum(payment.is_on_time() for payment in payments)
+        self.assertEqual((on_time, len(payments) - on_time), (2, 3))
+        # 300 base + int(2/5 * 150) on-time + 3 loans * 10 + tier 2 * 25 - 3 late * 20
+        self.assertEqual(self.customer.calculate_credit_score(), 380)
+
+
+
+class BulkRecomputeTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            username='batch-officer', password='pass', role='manager', phone_number='08000000007'
+        )
+        on_time, late, unpaid = (-30, -31, 'completed'), (-30, -20, 'completed'), (-5, None, 'pending')
+        histories = [
+            (1, []),
+            (2, [[on_time, on_time]]),
+            (3, [[on_time], [late, unpaid], []]),
+            (4, [[on_time] * 3, [on_time] * 2, [on_time], [on_time], [on_time]]),
+            (4, [[late] * 6, [unpaid] * 6]),
+        ]
+        self.customers = []
+        for n, (tier, loans) in enumerate(histories):
+            user = User.objects.create_user(
+                username=f'batch{n}', password='pass', role='customer', phone_number=f'0810000000{n}'
+            )
+            customer = Customer.objects.create(user=user, tier=tier)
+            for payments in loans:
+                add_loan(customer, self.staff, *payments)
+            self.customers.append(customer)
+
+    def stored_scores_and_limits(self):
+        rows = Customer.objects.filter(pk__in=[c.pk for c in self.customers]).order_by('pk')
+        return [(row.credit_score, row.current_borrow_limit) for row in rows]
+
+    def expected_scores_and_limits(self):
+        """Results of recompute_credit_and_limit() per customer, leaving the rows stale afterwards."""
+        for customer in self.customers:
+            customer.recompute_credit_and_limit()
+        expected = self.stored_scores_and_limits()
+        Customer.objects.filter(pk__in=[c.pk for c in self.customers]).update(
+            credit_score=300, current_borrow_limit=Decimal('1.00')
+        )
+        return expected
+
+    def test_bulk_recompute_matches_per_customer_recompute(self):
+        expected = self.expected_scores_and_limits()
+        self.assertEqual(len(set(expected)), len(expected))
+        before = timezone.now()
+
+        updated = Customer.bulk_recompute([c.pk for c in self.customers], batch_size=2)
+
+        self.assertEqual(updated, len(self.customers))
+        self.assertEqual(self.stored_scores_and_limits(), expected)
+        self.assertFalse(
+            Customer.objects.filter(pk__in=[c.pk for c in self.customers], updated_at__lt=before).exists()
+        )
+
+    def test_refresh_borrow_limits_matches_per_customer_recompute(self):
+        expected = self.expected_scores_and_limits()
+        for customer, (score, _) in zip(self.customers, expected):
+            Customer.objects.filter(pk=customer.pk).update(credit_score=score)
+
+        queryset = Customer.objects.filter(pk__in=[c.pk for c in self.customers])
+        self.assertEqual(queryset.refresh_borrow_limits(), len(self.customers))
+        self.assertEqual(self.stored_scores_and_limits(), expected)
+
+    def test_refresh_borrow_limits_applies_each_multiplier(self):
+        for scores in ([549, 550, 649, 650, 750], [300, 551, 651, 749, 850]):
+            for customer, score in zip(self.customers, scores):
+                Customer.objects.filter(pk=customer.pk).update(credit_score=score)
+                customer.refresh_from_db()
+                customer.update_borrow_limit()
+            expected = self.stored_scores_and_limits()
+            Customer.objects.update(current_borrow_limit=Decimal('1.00'))
+
+            Customer.objects.filter(pk__in=[c.pk for c in self.customers]).refresh_borrow_limits()
+
+            self.assertEqual(self.stored_scores_and_limits(), expected)
+
+
+
+class AccountNumberTests(TestCase):
+    def setUp(self):
+        self.existing = Customer.objects.create(
+            user=User.objects.create_user(
+                username='holder', password='pass', role='customer', phone_number='08000000008'
+            ),
+            account_number='1111111111',
+        )
+        self.user = User.objects.create_user(
+            username='newcomer', password='pass', role='customer', phone_number='08000000009'
+        )
+
+    def test_account_number_clash_retries_with_a_fresh_number(self):
+        with mock.patch.object(
+            Customer, 'generate_account_number', side_effect=['1111111111', '2222222222']
+        ) as generate:
+            customer = Customer.objects.create(user=self.user)
+
+        self.assertEqual(generate.call_count, 2)
+        self.assertEqual(customer.account_number, '2222222222')
+        self.assertEqual(Customer.objects.get(user=self.user).account_number, '2222222222')
+
+    def test_gives_up_after_repeated_clashes(self):
+        with mock.patch.object(Customer, 'generate_account_number', return_value='1111111111') as generate:
+            with self.assertRaises(IntegrityError):
+                Customer.objects.create(user=self.user)
+
+        self.assertEqual(generate.call_count, 3)
+        self.assertFalse(Customer.objects.filter(user=self.user).exists())
+
+    def test_other_integrity_errors_are_not_retried(self):
+        with mock.patch.object(Customer, 'generate_account_number', return_value='3333333333') as generate:
+            with self.assertRaises(IntegrityError):
+                Customer.objects.create(user=self.existing.user)
 
-# Create your tests here.
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(Customer.objects.count(), 1)
@@ -15,6 +15,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import login, logout
+from django.db import transaction
 from django.db.models import Q, Sum, Avg, Count
 from django.utils import timezone
 from datetime import datetime, timedelta
@@ -37,6 +38,7 @@ from .serializers import (
     CustomerAssignmentSerializer, StaffCustomerRegistrationSerializer
 )
 from .permissions import IsAdmin, IsAccountOfficer, IsCustomer
+from helpers.response.response_format import paginate_streaming_response
 
 class AuthViewSet(viewsets.GenericViewSet):
     """
@@ -319,16 +321,10 @@ class OTPViewSet(viewsets.GenericViewSet):
         serializer = OTPVerifySerializer(data=request.data)
         if serializer.is_valid():
             otp = serializer.validated_data['otp_instance']
-            otp.is_verified = True
-            otp.save()
+            OTPVerification.objects.filter(pk=otp.pk).update(is_verified=True)
             
-            # Update user phone verification status
-            try:
-                user = User.objects.get(phone_number=otp.phone_number)
-                user.is_phone_verified = True
-                user.save()
-            except User.DoesNotExist:
-                pass
+            # Update user phone verification status (the user may not exist yet)
+            User.objects.filter(phone_number=otp.phone_number).update(is_phone_verified=True)
             
             return Response({'message': 'OTP verified successfully'})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -364,6 +360,9 @@ class CustomerViewSet(viewsets.ModelViewSet):
             return CustomerCreateSerializer
         return CustomerDetailSerializer
     
+    def get_queryset(self):
+        return CustomerDetailSerializer.setup_eager_loading(super().get_queryset())
+    
     def get_permissions(self):
         """
         Return appropriate permissions based on action.
@@ -600,18 +599,20 @@ class CustomerViewSet(viewsets.ModelViewSet):
         elif request.user.role not in ['admin', 'account_officer']:
             return Response({'error': 'Access denied'}, status=status.HTTP_403_FORBIDDEN)
         
-        loans = customer.loans.all()
+        total_loans = customer.loans.count()
         base_score = 300
         on_time_payments = 0
         late_payments = 0
         
-        for loan in loans:
-            payments = loan.payments.all()
-            for payment in payments:
-                if payment.is_on_time():
-                    on_time_payments += 1
-                else:
-                    late_payments += 1
+        # Read just the two dates per payment, same rule as Payment.is_on_time()
+        payment_dates = Payment.objects.filter(loan__customer=customer).values_list(
+            'paid_date', 'due_date'
+        ).iterator(chunk_size=2000)
+        for paid_date, due_date in payment_dates:
+            if paid_date and due_date and paid_date <= due_date:
+                on_time_payments += 1
+            else:
+                late_payments += 1
         
         # Calculate factors
         on_time_payment_factor = 0
@@ -619,7 +620,7 @@ class CustomerViewSet(viewsets.ModelViewSet):
             on_time_ratio = on_time_payments / (on_time_payments + late_payments)
             on_time_payment_factor = int(on_time_ratio * 150)
         
-        loan_history_factor = min(loans.count() * 10, 50)
+        loan_history_factor = min(total_loans * 10, 50)
         tier_factor = customer.tier * 25
         late_payment_penalty = min(late_payments * 20, 200)
         
@@ -630,7 +631,7 @@ class CustomerViewSet(viewsets.ModelViewSet):
             'loan_history_factor': loan_history_factor,
             'tier_factor': tier_factor,
             'late_payment_penalty': late_payment_penalty,
-            'total_loans': loans.count(),
+            'total_loans': total_loans,
             'on_time_payments': on_time_payments,
             'late_payments': late_payments
         }
@@ -657,7 +658,7 @@ class CustomerViewSet(viewsets.ModelViewSet):
             status='completed'
         ).aggregate(total=Sum('amount'))['total'] or Decimal('0.00')
         
-        outstanding_balance = sum([loan.get_outstanding_balance() for loan in active_loans])
+        outstanding_balance = sum(loan.get_outstanding_balance() for loan in active_loans.with_balances())
         
         # Get next payment due
         next_payment = Payment.objects.filter(
@@ -708,11 +709,12 @@ class LoanViewSet(viewsets.ModelViewSet):
         return LoanSerializer
     
     def get_queryset(self):
+        loans = LoanSerializer.setup_eager_loading(Loan.objects.all())
         if self.request.user.role == 'customer':
-            return Loan.objects.filter(customer__user=self.request.user)
+            return loans.filter(customer__user=self.request.user)
         elif self.request.user.role == 'account_officer':
-            return Loan.objects.filter(requested_by=self.request.user)
-        return Loan.objects.all()
+            return loans.filter(requested_by=self.request.user)
+        return loans
     
     def get_permissions(self):
         if self.action == 'create':
@@ -818,10 +820,11 @@ class LoanViewSet(viewsets.ModelViewSet):
         
         loan.status = 'disbursed'
         loan.disbursed_at = timezone.now()
-        loan.save()
-        
-        # Create payment schedule
-        self.create_payment_schedule(loan)
+        with transaction.atomic():
+            loan.save()
+            
+            # Create payment schedule
+            self.create_payment_schedule(loan)
         
         # Update customer's account number if not set
         if not loan.customer.account_number:
@@ -842,16 +845,18 @@ class LoanViewSet(viewsets.ModelViewSet):
     def create_payment_schedule(self, loan):
         """Create payment schedule for disbursed loan"""
         monthly_payment = loan.calculate_monthly_payment()
+        start_date = loan.disbursed_at.date()
         
-        for month in range(loan.duration_months):
-            due_date = loan.disbursed_at.date() + timedelta(days=30 * (month + 1))
-            
-            Payment.objects.create(
+        schedule = [
+            Payment(
                 loan=loan,
                 amount=monthly_payment,
-                due_date=due_date,
+                due_date=start_date + timedelta(days=30 * (month + 1)),
                 status='pending'
             )
+            for month in range(loan.duration_months)
+        ]
+        Payment.objects.bulk_create(schedule, batch_size=500)
     
     @action(detail=True, methods=['post'])
     def request_another_loan(self, request, pk=None):
@@ -894,8 +899,7 @@ class LoanViewSet(viewsets.ModelViewSet):
         serializer = LoanCreateSerializer(data=loan_data)
         if serializer.is_valid():
             # Update customer's credit score and borrow limit
-            customer.update_credit_score()
-            customer.update_borrow_limit()
+            customer.recompute_credit_and_limit()
             
             loan = serializer.save(requested_by=customer.created_by)  # Request via account officer
             
@@ -911,9 +915,10 @@ class PaymentViewSet(viewsets.ModelViewSet):
     serializer_class = PaymentSerializer
     
     def get_queryset(self):
+        payments = PaymentSerializer.setup_eager_loading(Payment.objects.with_overdue())
         if self.request.user.role == 'customer':
-            return Payment.objects.filter(loan__customer__user=self.request.user)
-        return Payment.objects.all()
+            return payments.filter(loan__customer__user=self.request.user)
+        return payments
     
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -937,8 +942,7 @@ class PaymentViewSet(viewsets.ModelViewSet):
         payment.save()
         
         # Update customer credit score after payment
-        payment.loan.customer.update_credit_score()
-        payment.loan.customer.update_borrow_limit()
+        payment.loan.customer.recompute_credit_and_limit()
         
         # Check if loan is fully paid
         outstanding = payment.loan.get_outstanding_balance()
@@ -989,14 +993,18 @@ class AdminDashboardViewSet(viewsets.GenericViewSet):
     @action(detail=False, methods=['get'])
     def pending_approvals(self, request):
         """Get loans pending approval"""
-        pending_loans = Loan.objects.filter(status='pending').order_by('-created_at')
+        pending_loans = LoanSerializer.setup_eager_loading(
+            Loan.objects.filter(status='pending').order_by('-created_at')
+        )
         serializer = LoanSerializer(pending_loans, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def address_verifications(self, request):
         """Get customers with unverified addresses"""
-        customers = Customer.objects.filter(is_address_verified=False)
+        customers = CustomerDetailSerializer.setup_eager_loading(
+            Customer.objects.filter(is_address_verified=False)
+        )
         serializer = CustomerDetailSerializer(customers, many=True)
         return Response(serializer.data)
 
@@ -1006,7 +1014,7 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAdmin]
     
     def get_queryset(self):
-        queryset = AuditLog.objects.all().order_by('-timestamp')
+        queryset = AuditLogSerializer.setup_eager_loading(AuditLog.objects.all()).order_by('-timestamp')
         
         # Filter by date range
         start_date = self.request.query_params.get('start_date')
@@ -1028,6 +1036,18 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(action=action)
         
         return queryset
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream large pages of audit log entries (?page=, ?page_size= up to 1000)"""
+        try:
+            page_size = int(request.query_params.get('page_size', 500))
+        except ValueError:
+            page_size = 500
+        page_size = max(1, min(page_size, 1000))
+        return paginate_streaming_response(
+            request, AuditLogSerializer, self.filter_queryset(self.get_queryset()), page_size=page_size
+        )
 
 
 class CustomerSelfRegistrationViewSet(viewsets.GenericViewSet):
@@ -1348,17 +1368,18 @@ class KYCVerificationViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter KYC verifications based on user role"""
+        verifications = KYCVerificationSerializer.setup_eager_loading(KYCVerification.objects.all())
         if self.request.user.role == 'customer':
             # Customers can only see their own KYC verification
-            return KYCVerification.objects.filter(customer__user=self.request.user)
+            return verifications.filter(customer__user=self.request.user)
         elif self.request.user.role in ['account_officer', 'manager', 'relationship_officer']:
             # Staff can see KYC verifications for their assigned customers
-            return KYCVerification.objects.filter(
+            return verifications.filter(
                 customer__assigned_staff=self.request.user
             )
         else:
             # Admins can see all KYC verifications
-            return KYCVerification.objects.all()
+            return verifications
     
     def get_permissions(self):
         """Set permissions based on action"""
@@ -1373,7 +1394,7 @@ class KYCVerificationViewSet(viewsets.ModelViewSet):
         """Create KYC verification for the authenticated customer"""
         # Get the customer record for the authenticated user
         try:
-            customer = Customer.objects.get(user=self.request.user)
+            customer = Customer.objects.lean().get(user=self.request.user)
         except Customer.DoesNotExist:
             raise serializers.ValidationError("Customer record not found for this user.")
         
@@ -1667,10 +1688,12 @@ class CustomerAssignmentViewSet(viewsets.GenericViewSet):
         Returns:
             Response: List of customers pending assignment
         """
-        pending_customers = Customer.objects.filter(
-            approval_status='approved',
-            assigned_staff__isnull=True
-        ).order_by('-created_at')
+        pending_customers = CustomerDetailSerializer.setup_eager_loading(
+            Customer.objects.filter(
+                approval_status='approved',
+                assigned_staff__isnull=True
+            ).order_by('-created_at')
+        )
         
         serializer = CustomerDetailSerializer(pending_customers, many=True)
         return Response(serializer.data)